@@ -0,0 +1,43 @@
+"""add knowledge state and quiz attempt composite indexes
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-16 12:30:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_knowledge_states_user_id_topic_id',
+            'knowledge_states', ['user_id', 'topic_id'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_quiz_attempts_user_id_quiz_id_started_at',
+            'quiz_attempts', ['user_id', 'quiz_id', sa.text('started_at DESC')],
+            unique=False, postgresql_concurrently=True,
+        )
+
+        # Now covered by a composite with the same leading column
+        # (uq_user_project_topic_subtopic for knowledge_states)
+        op.drop_index('ix_knowledge_states_user_id', table_name='knowledge_states', postgresql_concurrently=True)
+        op.drop_index('ix_quiz_attempts_user_id', table_name='quiz_attempts', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_quiz_attempts_user_id', 'quiz_attempts', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_knowledge_states_user_id', 'knowledge_states', ['user_id'], unique=False, postgresql_concurrently=True)
+
+        op.drop_index('ix_quiz_attempts_user_id_quiz_id_started_at', table_name='quiz_attempts', postgresql_concurrently=True)
+        op.drop_index('ix_knowledge_states_user_id_topic_id', table_name='knowledge_states', postgresql_concurrently=True)
@@ -0,0 +1,47 @@
+"""add conversation list indexes
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 19:30:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conversations_user_id_updated_at',
+            'conversations', ['user_id', sa.text('updated_at DESC')],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_conversations_user_id_project_id_updated_at',
+            'conversations', ['user_id', 'project_id', sa.text('updated_at DESC')],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_conversations_quick_chats',
+            'conversations', ['user_id', sa.text('updated_at DESC')],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text('project_id IS NULL'),
+        )
+
+        # Now covered by the composites above (same leading column)
+        op.drop_index('ix_conversations_user_id', table_name='conversations', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_conversations_user_id', 'conversations', ['user_id'], unique=False, postgresql_concurrently=True)
+
+        op.drop_index('ix_conversations_quick_chats', table_name='conversations', postgresql_concurrently=True)
+        op.drop_index('ix_conversations_user_id_project_id_updated_at', table_name='conversations', postgresql_concurrently=True)
+        op.drop_index('ix_conversations_user_id_updated_at', table_name='conversations', postgresql_concurrently=True)
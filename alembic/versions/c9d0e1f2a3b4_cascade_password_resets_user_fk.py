@@ -0,0 +1,31 @@
+"""cascade password_resets.user_id on user delete
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-16 21:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Users are deleted with a single DELETE, so reset codes have to be
+    # removed by the database like every other child table
+    op.drop_constraint('password_resets_user_id_fkey', 'password_resets', type_='foreignkey')
+    op.create_foreign_key(
+        'password_resets_user_id_fkey', 'password_resets', 'users',
+        ['user_id'], ['id'], ondelete='CASCADE',
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('password_resets_user_id_fkey', 'password_resets', type_='foreignkey')
+    op.create_foreign_key(
+        'password_resets_user_id_fkey', 'password_resets', 'users',
+        ['user_id'], ['id'],
+    )
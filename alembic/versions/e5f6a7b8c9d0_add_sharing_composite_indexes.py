@@ -0,0 +1,61 @@
+"""add sharing composite indexes
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-16 10:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the newest grant per (conversation, user) so the unique index can be built
+    op.execute(
+        """
+        DELETE FROM conversation_access a
+        USING conversation_access b
+        WHERE a.conversation_id = b.conversation_id
+          AND a.user_id = b.user_id
+          AND (a.created_at, a.id) < (b.created_at, b.id)
+        """
+    )
+
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_shared_conversations_shared_by_user_id_created_at',
+            'shared_conversations', ['shared_by_user_id', 'created_at'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'uq_conversation_access_conversation_id_user_id',
+            'conversation_access', ['conversation_id', 'user_id'],
+            unique=True, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_conversation_access_user_id_created_at',
+            'conversation_access', ['user_id', 'created_at'],
+            unique=False, postgresql_concurrently=True,
+        )
+
+        # Now covered by the composites above (same leading column)
+        op.drop_index('ix_shared_conversations_shared_by_user_id', table_name='shared_conversations', postgresql_concurrently=True)
+        op.drop_index('ix_conversation_access_conversation_id', table_name='conversation_access', postgresql_concurrently=True)
+        op.drop_index('ix_conversation_access_user_id', table_name='conversation_access', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_conversation_access_user_id', 'conversation_access', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_conversation_access_conversation_id', 'conversation_access', ['conversation_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_shared_conversations_shared_by_user_id', 'shared_conversations', ['shared_by_user_id'], unique=False, postgresql_concurrently=True)
+
+        op.drop_index('ix_conversation_access_user_id_created_at', table_name='conversation_access', postgresql_concurrently=True)
+        op.drop_index('uq_conversation_access_conversation_id_user_id', table_name='conversation_access', postgresql_concurrently=True)
+        op.drop_index('ix_shared_conversations_shared_by_user_id_created_at', table_name='shared_conversations', postgresql_concurrently=True)
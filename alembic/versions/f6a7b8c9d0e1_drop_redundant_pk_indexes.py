@@ -0,0 +1,49 @@
+"""drop redundant indexes on primary keys
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-16 12:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Each primary key already has its own unique index (<table>_pkey);
+# these plain indexes on the same column only add write cost
+TABLES = [
+    'users',
+    'projects',
+    'conversations',
+    'documents',
+    'quizzes',
+    'messages',
+    'quiz_attempts',
+    'topics',
+    'subtopics',
+    'knowledge_states',
+    'quiz_questions',
+    'quiz_responses',
+    'password_resets',
+    'conversation_access',
+    'shared_conversations',
+    'conversation_forks',
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(f'ix_{table}_id', table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(f'ix_{table}_id', table, ['id'], unique=False, postgresql_concurrently=True)
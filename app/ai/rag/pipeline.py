@@ -288,7 +288,7 @@ class DocumentPipeline:
         self,
         document_id: UUID,
         project_id: UUID
-    ) -> int:
+    ) -> None:
         """
         Delete all chunks for a document.
         
@@ -298,10 +298,10 @@ class DocumentPipeline:
             document_id: Document UUID
             project_id: Project UUID
         
-        Returns:
-            Number of chunks deleted
+        Raises:
+            Exception: If the vector store delete fails
         """
-        return self.vector_store.delete_by_document(document_id, project_id)
+        self.vector_store.delete_by_document(document_id, project_id)
     
     def delete_project_chunks(self, project_id: UUID) -> bool:
         """
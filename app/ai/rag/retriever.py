@@ -187,7 +187,7 @@ class Retriever:
             query: User's question or search query
             project_id: Project to search in
             top_k: Maximum number of chunks to retrieve
-            min_score: Minimum relevance score (0-1)
+            min_score: Minimum cosine similarity (0-1)
             document_ids: Optional filter to specific documents
         
         Returns:
@@ -315,7 +315,7 @@ class Retriever:
         Args:
             query: User's question
             project_id: Project to check
-            threshold: Minimum score to consider relevant
+            threshold: Minimum cosine similarity to consider relevant
         
         Returns:
             True if relevant content exists
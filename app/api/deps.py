@@ -1,12 +1,14 @@
-from fastapi import HTTPException, Depends, Header, status
+from fastapi import HTTPException, Depends, Header, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional, Dict, Any
 import uuid
 import logging
-from datetime import datetime, timezone
+import time
 
+from app.core.config import settings
 from app.db.database import get_db, AsyncSessionLocal
+from app.db.redis import RateLimiter
 from app.models import User
 from app.core.security import get_token_remaining_time
 from app.services.auth_service import AuthService
@@ -83,7 +85,7 @@ async def get_token_info(
     return {
         "token": token,
         "remaining_time": remaining_time,
-        "expires_at": datetime.now(timezone.utc).timestamp() + remaining_time
+        "expires_at": time.time() + remaining_time
     }
 
 
@@ -114,3 +116,48 @@ async def get_current_user_ws(token: str) -> Optional[User]:
     except Exception as e:
         logger.error(f"WebSocket auth error: {e}")
         return None
+
+
+# =====================================================
+# Rate Limiting
+# =====================================================
+def get_client_ip(request: Request) -> str:
+    """
+    Best-effort client IP.
+    
+    X-Forwarded-For is only read when TRUSTED_PROXY_COUNT proxies sit in
+    front of the app (1 on Render). Each of them appends one entry, so the
+    client is the entry that many places from the right; anything further
+    left was sent by the client and can be forged. Without trusted
+    proxies the socket peer is used.
+    """
+    hops = settings.TRUSTED_PROXY_COUNT
+    forwarded = request.headers.get("x-forwarded-for")
+    if hops and forwarded:
+        entries = forwarded.split(",")
+        if len(entries) >= hops:
+            return entries[-hops].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(scope: str, limit: int, window_seconds: int = 60):
+    """
+    Build a dependency that rejects clients over `limit` requests per window.
+    
+    Usage:
+        @router.get("/path", dependencies=[Depends(rate_limit("scope", 30))])
+    
+    Raises:
+        HTTPException 429: If the client IP is over the limit
+    """
+    limiter = RateLimiter(scope, limit, window_seconds)
+    
+    async def dependency(request: Request) -> None:
+        if not await limiter.hit(get_client_ip(request)):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests, please slow down",
+                headers={"Retry-After": str(window_seconds)},
+            )
+    
+    return dependency
@@ -257,7 +257,7 @@ async def change_password(
     db: AsyncSession = Depends(get_db),
 ):
     """Change password for email-authenticated users."""
-    from app.core.security import verify_password, get_password_hash
+    from app.core.security import verify_password_async, get_password_hash_async
 
     if current_user.auth_provider != "email" or current_user.password_hash is None:
         raise HTTPException(
@@ -265,13 +265,13 @@ async def change_password(
             detail="This account uses Google Sign-In and has no password to change.",
         )
 
-    if not verify_password(request_data.current_password, current_user.password_hash):
+    if not await verify_password_async(request_data.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect.",
         )
 
-    current_user.password_hash = get_password_hash(request_data.new_password)
+    current_user.password_hash = await get_password_hash_async(request_data.new_password)
     await db.commit()
 
     return MessageResponse(message="Password changed successfully.", success=True)
@@ -121,6 +121,9 @@ async def create_conversation(
     - Set `project_id` to empty to get only quick chats
     
     Results are ordered by most recent activity.
+    
+    **Pagination:** pass the previous response's `next_cursor` as
+    `cursor` (preferred over `skip`, which gets slower on deep pages).
     """,
 )
 async def list_conversations(
@@ -130,20 +133,32 @@ async def list_conversations(
     ),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page"
+    ),
     current_user: User = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ):
     """List user's conversations."""
-    conversations = await service.list_conversations(
-        user_id=current_user.id,
-        project_id=project_id,
-        skip=skip,
-        limit=limit
-    )
+    try:
+        conversations, next_cursor = await service.list_conversations(
+            user_id=current_user.id,
+            project_id=project_id,
+            skip=skip,
+            limit=limit,
+            cursor=cursor
+        )
+    except ChatServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     return ConversationListResponse(
         conversations=conversations,
-        total=len(conversations)  # TODO: Add proper count
+        total=len(conversations),  # TODO: Add proper count
+        next_cursor=next_cursor
     )
 
 
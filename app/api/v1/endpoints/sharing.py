@@ -25,15 +25,18 @@ Forking:
 - POST   /conversations/{id}/fork          - Fork a conversation (with access)
 """
 
+import hashlib
 import logging
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, rate_limit
+from app.core.config import settings
 from app.models.user import User
 from app.schemas.sharing import (
     CreatePublicShareRequest,
@@ -54,6 +57,7 @@ from app.services.sharing_service import (
     SharingServiceError,
     ShareNotFoundError,
     AccessDeniedError,
+    is_streamed_share,
 )
 
 logger = logging.getLogger(__name__)
@@ -70,6 +74,38 @@ def get_sharing_service(db: AsyncSession = Depends(get_db)) -> SharingService:
     return SharingService(db)
 
 
+# Per-IP limit for the public /shared/{token} endpoints
+shared_rate_limit = rate_limit("shared", settings.SHARE_RATE_LIMIT_PER_MINUTE)
+
+# Browsers/CDNs may reuse a public share view for this long
+SHARED_VIEW_CACHE_CONTROL = "public, max-age=30"
+
+
+def _compute_etag(body: bytes) -> str:
+    """Strong ETag over a serialized response body."""
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+async def _stream_shared_conversation(shared: SharedConversationFull):
+    """Yield the SharedConversationFull JSON with messages streamed from the DB."""
+    head = shared.model_dump_json(exclude={"messages"}).encode("utf-8")
+    yield head[:-1] + b',"messages":['
+    async for chunk in SharingService.stream_message_json(shared.conversation_id):
+        yield chunk
+    yield b"]}"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (list or W/-prefixed) against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = {
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    }
+    return etag in candidates or "*" in candidates
+
+
 # ============================================================
 # PUBLIC SHARE LINKS
 # ============================================================
@@ -251,6 +287,7 @@ async def get_share_stats(
 @router.get(
     "/shared/{token}",
     response_model=SharedConversationFull,
+    dependencies=[Depends(shared_rate_limit)],
     summary="View shared conversation",
     description="""
     View a shared conversation using its share token.
@@ -260,24 +297,54 @@ async def get_share_stats(
 )
 async def view_shared_conversation(
     token: str,
+    request: Request,
     service: SharingService = Depends(get_sharing_service),
 ):
-    """View a shared conversation by token."""
+    """
+    View a shared conversation by token.
+    
+    Responses carry an ETag and a short public Cache-Control. A matching
+    If-None-Match gets a 304 and is not counted as a view. Conversations
+    longer than SHARE_STREAM_MIN_MESSAGES are streamed (no ETag) instead.
+    
+    The service already returns a validated SharedConversationFull, so it
+    is serialized once here and returned as a raw Response; FastAPI skips
+    re-validating it against response_model (kept for the OpenAPI docs).
+    """
     try:
-        return await service.get_share_by_token(
+        shared = await service.get_share_by_token(
             token=token,
-            increment_views=True,
+            increment_views=False,
         )
     except ShareNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    
+    if is_streamed_share(shared):
+        await service.record_view(token, share_id=shared.share_id)
+        return StreamingResponse(
+            _stream_shared_conversation(shared),
+            media_type="application/json",
+            headers={"Cache-Control": SHARED_VIEW_CACHE_CONTROL},
+        )
+    
+    body = shared.model_dump_json().encode("utf-8")
+    etag = _compute_etag(body)
+    headers = {"ETag": etag, "Cache-Control": SHARED_VIEW_CACHE_CONTROL}
+    
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    await service.record_view(token, share_id=shared.share_id)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post(
     "/shared/{token}/fork",
     response_model=ConversationForkResponse,
+    dependencies=[Depends(shared_rate_limit)],
     status_code=status.HTTP_201_CREATED,
     summary="Fork a shared conversation",
     description="""
@@ -430,26 +497,14 @@ async def fork_conversation(
     if data is None:
         data = ForkConversationRequest()
     
-    # Check access
-    can_view = await service.can_view_conversation(
-        conversation_id=conversation_id,
-        user_id=current_user.id,
-    )
-    
-    if not can_view:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this conversation"
-        )
-    
     try:
-        return await service.fork_conversation(
+        return await service.fork_conversation_if_allowed(
             conversation_id=conversation_id,
             user_id=current_user.id,
             initial_message=data.initial_message,
         )
-    except ShareNotFoundError as e:
+    except AccessDeniedError as e:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e)
         )
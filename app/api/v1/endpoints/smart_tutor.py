@@ -11,6 +11,7 @@ Provides intelligent, adaptive learning features:
 """
 
 import logging
+from datetime import date
 from typing import Optional
 from uuid import UUID
 
@@ -76,7 +77,7 @@ async def smart_suggestions(
 )
 async def study_plan(
     project_id: UUID,
-    exam_date: Optional[str] = Query(default=None, description="YYYY-MM-DD"),
+    exam_date: Optional[date] = Query(default=None, description="YYYY-MM-DD"),
     daily_hours: float = Query(default=2.0, ge=0.5, le=12),
     current_user: User = Depends(get_current_user),
     service: SmartTutorService = Depends(get_service),
@@ -142,4 +143,7 @@ async def learning_style(
     current_user: User = Depends(get_current_user),
     service: SmartTutorService = Depends(get_service),
 ):
+    # get_current_user's lookup left a transaction open on the request
+    # session; end it so the connection is free during the fan-out
+    await service.db.commit()
     return await service.detect_learning_style(current_user.id)
@@ -62,4 +62,18 @@ api_router.include_router(
 api_router.include_router(
     smart_tutor.router,
     prefix=""  # Routes define own prefix (/smart/*)
-)
\ No newline at end of file
+)
+
+
+# ============================================================
+# Duplicate Route Guard
+# ============================================================
+# Starlette matches routes by linear scan, so a router included twice
+# would silently double dispatch cost. Fail fast at import instead.
+# (Same path with different methods is fine, e.g. GET/DELETE /shares/{id}.)
+_route_keys = [
+    (route.path, frozenset(getattr(route, "methods", None) or ()))
+    for route in api_router.routes
+]
+if len(set(_route_keys)) != len(_route_keys):
+    raise RuntimeError("Duplicate routes registered on api_router")
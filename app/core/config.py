@@ -1,18 +1,26 @@
-from typing import List, Optional
+import os
+from functools import cached_property, lru_cache
+from typing import List, Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import AnyUrl, EmailStr, Field, field_validator
+from pydantic import AnyUrl, EmailStr, Field
 import secrets
 
 
+# Deployments that inject config through real env vars (e.g. Render) set
+# SKIP_DOTENV=1 so each worker doesn't open and parse a .env file
+_ENV_FILE = None if os.getenv("SKIP_DOTENV") == "1" else ".env"
+
+
 class Settings(BaseSettings):
     """
     Application settings loaded from environment variables or .env.
     """
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=_ENV_FILE,
         env_file_encoding="utf-8",
-        extra="ignore"  # Ignore extra fields in .env file
-    )  
+        extra="ignore",  # Ignore extra fields in .env file
+        frozen=True,     # Read-only after load; nothing reassigns settings at runtime
+    )
 
     # -------------------------
     # Database
@@ -23,9 +31,21 @@ class Settings(BaseSettings):
     # Security / Auth
     # -------------------------
     SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
-    ALGORITHM: str = "HS256"
+    # Tokens are signed with SECRET_KEY, so only the HMAC algorithms apply
+    ALGORITHM: Literal["HS256", "HS384", "HS512"] = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = Field(
+        default=12,
+        ge=4,
+        le=15,
+        description="bcrypt work factor for new password hashes (each +1 doubles cost)"
+    )
+    BCRYPT_TARGET_MS: Optional[int] = Field(
+        default=None,
+        ge=50,
+        description="If set, calibrate bcrypt rounds at startup to the highest cost under this many ms"
+    )
 
     # -------------------------
     # Email / SMTP
@@ -58,11 +78,37 @@ class Settings(BaseSettings):
     SQLALCHEMY_ECHO: bool = False
     DB_POOL_MIN_SIZE: Optional[int] = None
     DB_POOL_MAX_SIZE: Optional[int] = None
+    DB_POOL_PRE_PING: bool = Field(
+        default=True,
+        description="Validate each pooled connection with SELECT 1 on checkout "
+                    "(keep on for providers that drop idle connections, e.g. Neon)"
+    )
+    DB_POOL_TIMEOUT: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds to wait for a free pooled connection before erroring"
+    )
+    DB_POOL_WARM_SIZE: int = Field(
+        default=5,
+        ge=0,
+        description="Connections to pre-open at startup (capped at the pool size, 0 disables)"
+    )
 
     SENTRY_DSN: Optional[AnyUrl] = None
 
     PASSWORD_RESET_TOKEN_EXPIRE_MINUTES: int = 15
 
+    SHUTDOWN_TIMEOUT: float = Field(
+        default=10.0,
+        gt=0,
+        description="Max seconds to wait for connection pools to close on shutdown"
+    )
+    HEALTH_PROBE_INTERVAL: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds between background dependency probes that feed /health"
+    )
+
     # -------------------------
     # Google OAuth
     # -------------------------
@@ -86,13 +132,58 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0",
         description="Redis connection URL for task queue and caching"
     )
-    
+    REDIS_POOL_SIZE: int = Field(
+        default=50,
+        ge=1,
+        description="Max connections in the app's Redis pool (caching, rate limiting, view counts)"
+    )
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = Field(
+        default=0.5,
+        gt=0,
+        description="Seconds to wait for a Redis TCP connect before falling back"
+    )
+    REDIS_SOCKET_TIMEOUT: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds to wait for a Redis reply before falling back"
+    )
+    REDIS_POOL_WARM_SIZE: int = Field(
+        default=5,
+        ge=0,
+        description="Redis connections to pre-open at startup (0 disables)"
+    )
+    SHARE_CACHE_TTL_SECONDS: int = Field(
+        default=60,
+        ge=0,
+        description="TTL for cached public share payloads (0 disables the cache)"
+    )
+    SHARE_STREAM_MIN_MESSAGES: int = Field(
+        default=500,
+        ge=1,
+        description="Public shares with more messages than this are streamed, not cached"
+    )
+    SHARE_VIEW_FLUSH_INTERVAL: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds between flushes of Redis-buffered share view counts to the database"
+    )
+    SHARE_RATE_LIMIT_PER_MINUTE: int = Field(
+        default=30,
+        ge=1,
+        description="Requests per minute per client IP for /shared/{token} endpoints"
+    )
+    TRUSTED_PROXY_COUNT: int = Field(
+        default=0,
+        ge=0,
+        description="Reverse proxies in front of the app that append X-Forwarded-For (0 ignores the header)"
+    )
+
     # -------------------------
     # File Storage
     # -------------------------
-    STORAGE_BACKEND: str = Field(
+    STORAGE_BACKEND: Literal["local", "cloudinary", "s3", "gcs"] = Field(
         default="local",
-        description="Storage backend: 'local', 's3', or 'gcs'"
+        description="Storage backend: 'local', 'cloudinary', 's3', or 'gcs'"
     )
     UPLOAD_DIR: str = Field(
         default="storage/uploads",
@@ -105,8 +196,8 @@ class Settings(BaseSettings):
         description="Maximum file upload size in megabytes"
     )
 
-    # Computed property for bytes (used in validation)
-    @property
+    # Computed once per instance (used in validation)
+    @cached_property
     def MAX_FILE_SIZE_BYTES(self) -> int:
         """Convert MB to bytes for file size validation."""
         return self.MAX_FILE_SIZE_MB * 1024 * 1024
@@ -160,6 +251,16 @@ class Settings(BaseSettings):
         description="ChromaDB server port"
     )
 
+    VECTOR_SEARCH_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache identical vector searches for a few seconds"
+    )
+    VECTOR_ADD_PARALLEL_THRESHOLD: int = Field(
+        default=0,
+        ge=0,
+        description="Insert chunk batches larger than this with parallel threads (0 disables)"
+    )
+
     # For ChromaDB Cloud (cloud.trychroma.com)
     CHROMA_API_KEY: Optional[str] = Field(
         default=None,
@@ -239,18 +340,15 @@ class Settings(BaseSettings):
     )
 
 
-    @field_validator("ALGORITHM")
-    def validate_algorithm(cls, v):
-        if not v or not isinstance(v, str):
-            raise ValueError("ALGORITHM must be a non-empty string.")
-        return v
-    
-    @field_validator("STORAGE_BACKEND")
-    def validate_storage_backend(cls, v):
-        """Ensure storage backend is a valid option."""
-        allowed = {"local", "cloudinary", "s3", "gcs"}
-        if v not in allowed:
-            raise ValueError(f"STORAGE_BACKEND must be one of: {allowed}")
-        return v
-    
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings once, on first use."""
+    return Settings()
+
+
+def __getattr__(name: str):
+    # `from app.core.config import settings` resolves here (PEP 562), so the
+    # .env is only parsed when something actually needs a setting.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,46 @@
+"""
+Logging Setup
+
+Configures the root logger once per process. Log records are put on an
+in-memory queue by a QueueHandler and written to stderr by a
+QueueListener thread, so a logger.info() on the event loop never blocks
+on terminal or pipe I/O.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: str = "INFO") -> None:
+    """
+    Configure root logging (idempotent).
+
+    Safe to call more than once (reloads, app + worker imports): handlers
+    are only installed the first time, and never on top of handlers some
+    other entry point already configured.
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+
+    if _listener is not None or root.handlers:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # Flush whatever is still queued on interpreter exit
+    atexit.register(_listener.stop)
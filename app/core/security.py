@@ -1,7 +1,17 @@
-from datetime import datetime, timezone, timedelta
-from typing import Any, Union, Optional, Dict
-import uuid
-
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Union, Optional, Dict, Tuple
+import secrets
+
+import orjson
 from jose import JWTError, jwt
 
 # Use bcrypt directly to avoid passlib/bcrypt version conflicts
@@ -12,41 +22,134 @@ import bcrypt
 # =====================================================
 from app.core.config import settings
 
+# JWT parameters resolved once instead of on every encode/decode
+_JWT_KEY = settings.SECRET_KEY
+_JWT_ALGORITHM = settings.ALGORITHM
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+_SKIP_EXP_CHECK = {"verify_exp": False}
+
+
+# =====================================================
+# HMAC JWT Encoding
+# =====================================================
+# ALGORITHM is restricted to the HS* family, so tokens are signed here
+# directly instead of through jose's generic key/algorithm dispatch.
+# Decoding still goes through jose.
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url, as used by JWS."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+_JWT_KEY_BYTES = _JWT_KEY.encode("utf-8")
+_JWT_DIGEST = _HMAC_DIGESTS[_JWT_ALGORITHM]
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": _JWT_ALGORITHM, "typ": "JWT"}))
+
+
+def _encode_jwt(claims: Dict[str, Any]) -> str:
+    """Sign claims as a compact HS* JWT."""
+    payload = orjson.dumps(claims)  # compact UTF-8 bytes, no encode step
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(payload)
+    signature = hmac.new(_JWT_KEY_BYTES, signing_input, _JWT_DIGEST).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
 
 # =====================================================
 # Password Hashing Context
 # =====================================================
+# bcrypt only uses the first 72 bytes of a password; bcrypt>=5 raises
+# instead of truncating, so truncate explicitly (same hashes as before)
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Work factor for new hashes; startup calibration may replace it
+_bcrypt_rounds = settings.BCRYPT_ROUNDS
+
 class PasswordContext:
     """
     Simple password hashing and verification utility.
     Replaces passlib to avoid version conflicts.
+
+    Backed by the Rust implementation in bcrypt>=4 (pinned in
+    requirements.txt); hashing cost is tuned with BCRYPT_ROUNDS.
     """
 
     @staticmethod
     def hash(password: str) -> str:
         """
         Hash a plain-text password using bcrypt.
+
+        Cost comes from settings.BCRYPT_ROUNDS (or startup calibration);
+        verify() reads the cost from the stored hash, so changing it
+        doesn't break old hashes.
         """
         return bcrypt.hashpw(
-            password.encode("utf-8"),
-            bcrypt.gensalt()
-        ).decode("utf-8")
+            password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+            bcrypt.gensalt(rounds=_bcrypt_rounds)
+        ).decode("ascii")
 
     @staticmethod
     def verify(plain_password: str, hashed_password: str) -> bool:
         """
         Verify a plain-text password against a bcrypt hash.
         """
-        return bcrypt.checkpw(
-            plain_password.encode("utf-8"),
-            hashed_password.encode("utf-8")
-        )
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+                hashed_password.encode("ascii")  # bcrypt hashes are pure ASCII
+            )
+        except (ValueError, UnicodeEncodeError):
+            # Malformed/non-bcrypt stored hash: treat as a failed login
+            return False
 
 
 # Password context instance
 pwd_context = PasswordContext()
 
 
+# =====================================================
+# bcrypt Cost Calibration
+# =====================================================
+BCRYPT_MIN_CALIBRATED_ROUNDS = 10
+BCRYPT_MAX_CALIBRATED_ROUNDS = 15
+
+
+def calibrate_bcrypt_rounds(target_ms: int) -> int:
+    """
+    Find the highest bcrypt cost that hashes in under target_ms on this host.
+
+    Never returns less than BCRYPT_MIN_CALIBRATED_ROUNDS. Each extra round
+    doubles the time, so this stops at the first cost over the target.
+    """
+    rounds = BCRYPT_MIN_CALIBRATED_ROUNDS
+    for candidate in range(BCRYPT_MIN_CALIBRATED_ROUNDS, BCRYPT_MAX_CALIBRATED_ROUNDS + 1):
+        start = time.perf_counter()
+        bcrypt.hashpw(b"x" * 16, bcrypt.gensalt(rounds=candidate))
+        if (time.perf_counter() - start) * 1000 >= target_ms:
+            break
+        rounds = candidate
+    return rounds
+
+
+def apply_bcrypt_calibration(target_ms: int) -> int:
+    """
+    Calibrate for this host and use the result for new hashes.
+
+    Not cached on disk: a cache could outlive the hardware it was timed on
+    (a reused image or volume), and the timing run is only a few hashes.
+    Blocking - call it from a thread at startup.
+    """
+    global _bcrypt_rounds
+
+    _bcrypt_rounds = calibrate_bcrypt_rounds(target_ms)
+    return _bcrypt_rounds
+
+
 # =====================================================
 # Token Type Constants
 # =====================================================
@@ -57,6 +160,30 @@ TOKEN_TYPE_REFRESH = "refresh"
 # =====================================================
 # JWT Creation Functions
 # =====================================================
+# Default lifetimes in seconds, resolved once
+_ACCESS_TOKEN_LIFETIME = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_REFRESH_TOKEN_LIFETIME = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+
+
+def _issue_token(
+    subject: Union[str, Any],
+    token_type: str,
+    lifetime_seconds: int,
+) -> str:
+    """Build the fixed-shape claims and sign them."""
+    # Current UTC time as integer epoch seconds (what JWT stores anyway)
+    now = int(time.time())
+
+    # JWT payload - a literal dict is the cheapest fixed-shape build
+    return _encode_jwt({
+        "exp": now + lifetime_seconds,     # Expiration time
+        "sub": str(subject),               # Subject (usually user ID)
+        "type": token_type,                # Token type
+        "iat": now,                        # Issued at
+        "jti": secrets.token_hex(16),      # JWT ID (used for revocation)
+    })
+
+
 def create_access_token(
     subject: Union[str, Any],
     expires_delta: Optional[timedelta] = None
@@ -64,33 +191,8 @@ def create_access_token(
     """
     Create a JWT access token.
     """
-    # Current UTC time (timezone-aware)
-    now = datetime.now(timezone.utc)
-
-    # Determine expiration time
-    if expires_delta:
-        expire = now + expires_delta
-    else:
-        expire = now + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-
-    # JWT payload
-    to_encode = {
-        "exp": expire,                     # Expiration time
-        "sub": str(subject),               # Subject (usually user ID)
-        "type": TOKEN_TYPE_ACCESS,         # Token type
-        "iat": now,                        # Issued at
-        "jti": str(uuid.uuid4())           # Unique token ID
-    }
-
-    # Encode JWT
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
-    )
-    return encoded_jwt
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TOKEN_LIFETIME
+    return _issue_token(subject, TOKEN_TYPE_ACCESS, lifetime)
 
 
 def create_refresh_token(
@@ -100,33 +202,53 @@ def create_refresh_token(
     """
     Create a JWT refresh token.
     """
-    # Current UTC time (timezone-aware)
-    now = datetime.now(timezone.utc)
-
-    # Determine expiration time
-    if expires_delta:
-        expire = now + expires_delta
-    else:
-        expire = now + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
-
-    # JWT payload
-    to_encode = {
-        "exp": expire,                     # Expiration time
-        "sub": str(subject),               # Subject
-        "type": TOKEN_TYPE_REFRESH,        # Token type
-        "iat": now,                        # Issued at
-        "jti": str(uuid.uuid4())            # JWT ID (used for revocation)
-    }
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _REFRESH_TOKEN_LIFETIME
+    return _issue_token(subject, TOKEN_TYPE_REFRESH, lifetime)
 
-    # Encode JWT
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
-    )
-    return encoded_jwt
+
+# =====================================================
+# Decoded Payload Cache
+# =====================================================
+# The same bearer token arrives on every request of a session, so keep
+# its signature-checked payload for a short while instead of re-running
+# HMAC + JSON parsing each time. Keys are SHA-256 digests so raw tokens
+# aren't held in memory. Expiry is still checked on every use.
+_PAYLOAD_CACHE_MAXSIZE = 10_000
+_PAYLOAD_CACHE_TTL_SECONDS = 30
+
+_payload_cache: "OrderedDict[bytes, tuple[float, Dict[str, Any]]]" = OrderedDict()
+_payload_cache_lock = threading.Lock()
+
+
+def _decode_cached(token: str) -> Dict[str, Any]:
+    """
+    Decode and signature-check a token, without checking exp.
+
+    Returns a shared dict - callers must not mutate it.
+
+    Raises:
+        JWTError: If the token is malformed or the signature is wrong
+                  (failures are never cached)
+    """
+    key = hashlib.sha256(token.encode("utf-8")).digest()
+    now = time.monotonic()
+
+    with _payload_cache_lock:
+        entry = _payload_cache.get(key)
+        if entry is not None:
+            if entry[0] > now:
+                _payload_cache.move_to_end(key)
+                return entry[1]
+            del _payload_cache[key]
+
+    payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS, options=_SKIP_EXP_CHECK)
+
+    with _payload_cache_lock:
+        _payload_cache[key] = (now + _PAYLOAD_CACHE_TTL_SECONDS, payload)
+        if len(_payload_cache) > _PAYLOAD_CACHE_MAXSIZE:
+            _payload_cache.popitem(last=False)
+
+    return payload
 
 
 # =====================================================
@@ -140,22 +262,18 @@ def verify_token(
     Verify a JWT token and return its payload if valid.
     """
     try:
-        # Decode JWT
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-
-        # Validate token type
-        if payload.get("type") != token_type:
-           raise ValueError("Invalid token type")
+        # Decode JWT (cached; exp is checked below on every call)
+        payload = _decode_cached(token)
 
         # Validate expiration time
         exp = payload.get("exp")
-        if exp and datetime.now(timezone.utc).timestamp() > exp:
+        if not isinstance(exp, (int, float)) or time.time() > exp:
             return None
 
+        # Validate token type
+        if payload.get("type") != token_type:
+           raise ValueError("Invalid token type")
+
         return payload
 
     except JWTError:
@@ -199,6 +317,30 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# bcrypt is deliberately slow (~100ms+) and releases the GIL, so async code
+# runs it on its own pool: the event loop keeps serving other requests, and
+# a burst of logins can't exhaust the default threadpool used for other
+# blocking work.
+_password_executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 2),
+    thread_name_prefix="bcrypt",
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
+
+
 # =====================================================
 # Token Helper Functions
 # =====================================================
@@ -217,47 +359,39 @@ def create_token_pair(subject: Union[str, Any]) -> Dict[str, Any]:
     }
 
 
-def is_token_expired(token: str) -> bool:
+def get_token_exp_info(token: str) -> Tuple[bool, Optional[int]]:
     """
-    Check whether a token is expired using timezone-aware timestamps.
+    Decode a token once and report its expiry.
+
+    Returns:
+        (is_expired, remaining_seconds); remaining is None if the token
+        is invalid or has no exp claim (both count as expired)
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": False}
-        )
+        payload = _decode_cached(token)
+    except JWTError:
+        return True, None
 
-        exp = payload.get("exp")
-        if exp:
-            return datetime.now(timezone.utc).timestamp() > exp
-        return True
+    exp = payload.get("exp")
+    if not exp:
+        return True, None
 
-    except JWTError:
-        return True
+    now = time.time()
+    return now > exp, max(0, int(exp - now))
 
 
-def get_token_remaining_time(token: str) -> Optional[int]:
+def is_token_expired(token: str) -> bool:
     """
-    Get remaining time (in seconds) before token expiration.
+    Check whether a token is expired (exp is UTC epoch seconds).
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": False}
-        )
+    return get_token_exp_info(token)[0]
 
-        exp = payload.get("exp")
-        if exp:
-            remaining = exp - datetime.now(timezone.utc).timestamp()
-            return max(0, int(remaining))
-        return None
 
-    except JWTError:
-        return None
+def get_token_remaining_time(token: str) -> Optional[int]:
+    """
+    Get remaining time (in seconds) before token expiration.
+    """
+    return get_token_exp_info(token)[1]
 
 
 # This Function used to get user_id from token
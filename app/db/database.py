@@ -1,4 +1,5 @@
 import ssl 
+import asyncio
 import logging
 from typing import AsyncGenerator
 
@@ -12,7 +13,6 @@ from ..core.config import settings
 # Logging
 # ----------------------------------------------------
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.INFO)
 
 # Base for all ORM models
 Base = declarative_base()
@@ -33,17 +33,33 @@ def build_ssl_context():
 # ----------------------------------------------------
 # Engine Configuration
 # ----------------------------------------------------
+def pool_limits() -> tuple[int, int]:
+    """
+    (pool_size, max_overflow) for the engine.
+
+    DB_POOL_MIN_SIZE is the persistent pool; DB_POOL_MAX_SIZE caps
+    pool + overflow so bursts don't queue on connection checkout.
+    """
+    pool_size = settings.DB_POOL_MIN_SIZE or 20
+    max_size = settings.DB_POOL_MAX_SIZE or pool_size + 40
+    return pool_size, max(0, max_size - pool_size)
+
+
 def build_engine():
     # Cloud PostgreSQL (Neon)
     ssl_context = build_ssl_context()
 
+    pool_size, max_overflow = pool_limits()
+
     engine_kwargs = {
         "echo": settings.DEBUG,
         "future": True,
-        "pool_size": 10,
-        "max_overflow": 5,
-        "pool_timeout": 30,
-        "pool_pre_ping": True,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        # Fail fast when the pool is exhausted instead of queueing requests
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        # Per-checkout SELECT 1; see DB_POOL_PRE_PING
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
         "pool_recycle": 3600,  # refresh connections every hour
         "connect_args": {
             "ssl": ssl_context,
@@ -128,6 +144,33 @@ async def check_db_connection() -> bool:
         return False
 
 
+async def warm_connection_pool(size: int) -> int:
+    """
+    Open up to `size` pooled connections concurrently and return them to
+    the pool, so the first burst of requests doesn't pay connect + TLS
+    latency on each slot. Capped at the persistent pool size (overflow
+    connections are discarded on release anyway).
+    Returns the number of connections opened.
+    """
+    size = min(size, engine.pool.size())
+    if size <= 0:
+        return 0
+
+    opened = []
+
+    async def _open():
+        conn = await engine.connect()
+        opened.append(conn)
+        await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(_open() for _ in range(size)), return_exceptions=True)
+    finally:
+        for conn in opened:
+            await conn.close()
+    return len(opened)
+
+
 async def invalidate_connection_pool():
     """
     Clears all cached prepared statements after database schema changes.
@@ -3,7 +3,8 @@ Redis Connection Module
 
 This module provides async Redis connection management for:
 1. ARQ task queue (document processing)
-2. Future: Caching, rate limiting, session storage
+2. Caching and rate limiting
+3. Future: Session storage
 
 Redis is an in-memory data store that we use as a message broker
 for background tasks. When a user uploads a file, we:
@@ -14,14 +15,22 @@ for background tasks. When a user uploads a file, we:
 A separate worker process pulls tasks from Redis and processes them.
 """
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional
+from urllib.parse import unquote, urlparse
 
 from redis.asyncio import Redis, ConnectionPool
-from arq.connections import RedisSettings, ArqRedis, create_pool
 
 from app.core.config import settings
 
+# arq is only needed once a task is enqueued (or by the worker), so it is
+# imported lazily to keep it off the API's startup path
+if TYPE_CHECKING:
+    from arq.connections import RedisSettings, ArqRedis
+
 # ============================================================
 # Logging Setup
 # ============================================================
@@ -34,6 +43,12 @@ logger = logging.getLogger(__name__)
 # Global connection pool - initialized once, reused everywhere
 _redis_pool: Optional[ConnectionPool] = None
 
+# Single client on top of the pool (Redis objects are safe to share)
+_redis_client: Optional[Redis] = None
+
+# Separate client for long-lived Pub/Sub listeners (see get_pubsub_redis)
+_pubsub_client: Optional[Redis] = None
+
 def get_redis_pool() -> ConnectionPool:
     """
     Get or create the Redis connection pool.
@@ -46,8 +61,15 @@ def get_redis_pool() -> ConnectionPool:
     if _redis_pool is None:
         _redis_pool = ConnectionPool.from_url(
             settings.REDIS_URL,
-            max_connections=10,      # Max simultaneous connections
+            max_connections=settings.REDIS_POOL_SIZE,  # Max simultaneous connections
             decode_responses=False,  # Return bytes (needed for some operations)
+            socket_keepalive=True,   # Keep idle connections from being dropped silently
+            health_check_interval=30,  # PING connections idle longer than this before reuse
+            # Short timeouts: callers (rate limiter, share cache, view
+            # buffer) fall back when Redis errors, which only helps if an
+            # unreachable Redis fails fast instead of hanging on TCP
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
         )
         logger.info(f"Redis connection pool created: {settings.REDIS_URL}")
     
@@ -63,8 +85,33 @@ async def get_redis() -> Redis:
         async def my_endpoint(redis: Redis = Depends(get_redis)):
             await redis.set("key", "value")
     """
-    pool = get_redis_pool()
-    return Redis(connection_pool=pool)    
+    global _redis_client
+    
+    if _redis_client is None:
+        _redis_client = Redis(connection_pool=get_redis_pool())
+    
+    return _redis_client
+
+
+def get_pubsub_redis() -> Redis:
+    """
+    Get the Redis client for Pub/Sub listeners.
+    
+    A listener blocks reading until a message arrives, so it can't use
+    the app pool's short socket_timeout (an idle listen() would time
+    out); it gets its own connections with only a connect timeout.
+    """
+    global _pubsub_client
+    
+    if _pubsub_client is None:
+        _pubsub_client = Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,
+            socket_keepalive=True,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        )
+    
+    return _pubsub_client
 
 
 async def close_redis_pool():
@@ -73,7 +120,13 @@ async def close_redis_pool():
     
     Called from FastAPI lifespan events to clean up resources.
     """
-    global _redis_pool
+    global _redis_pool, _redis_client, _pubsub_client
+    
+    _redis_client = None
+    
+    if _pubsub_client is not None:
+        await _pubsub_client.aclose()
+        _pubsub_client = None
     
     if _redis_pool is not None:
         await _redis_pool.disconnect()
@@ -85,12 +138,15 @@ async def close_redis_pool():
 # ARQ Redis Settings (for task queue)
 # ============================================================
 
-def get_arq_redis_settings() -> RedisSettings:
+@lru_cache(maxsize=1)
+def get_arq_redis_settings() -> "RedisSettings":
     """
     Get Redis settings for ARQ task queue.
     
-    ARQ uses its own RedisSettings class that parses the URL
-    and extracts host, port, database, and password.
+    Cached - REDIS_URL doesn't change for the life of the process.
+    
+    ARQ uses its own RedisSettings class, so the URL is split into
+    host, port, database, and password with urllib.parse.
     
     Supports both:
     - redis://  (unencrypted, for local development)
@@ -99,53 +155,21 @@ def get_arq_redis_settings() -> RedisSettings:
     Returns:
         RedisSettings configured from REDIS_URL
     """
-    url = settings.REDIS_URL
-    
-    # Default values
-    host = "localhost"
-    port = 6379
-    database = 0
-    password = None
-    use_ssl = False
-
-    # Detect protocol and extract the URL body
-    if url.startswith("rediss://"):
-        # TLS/SSL connection (Upstash, Redis Cloud, etc.)
-        use_ssl = True
-        url_body = url[len("rediss://"):]
-    elif url.startswith("redis://"):
-        # Standard unencrypted connection (local Docker, etc.)
-        use_ssl = False
-        url_body = url[len("redis://"):]
-    else:
-        # Fallback — treat as hostname
-        url_body = url
-    
-    # Parse auth (username:password@)
-    if "@" in url_body:
-        auth, url_body = url_body.split("@", 1)
-        if ":" in auth:
-            _, password = auth.split(":", 1)
-        else:
-            password = auth
-    
-    # Parse database number (/0, /1, etc.)
-    if "/" in url_body:
-        url_body, db_str = url_body.rsplit("/", 1)
-        try:
-            database = int(db_str)
-        except ValueError:
-            database = 0
+    from arq.connections import RedisSettings
     
-    # Parse host:port
-    if ":" in url_body:
-        host, port_str = url_body.split(":", 1)
-        try:
-            port = int(port_str)
-        except ValueError:
-            port = 6379
-    else:
-        host = url_body or "localhost"
+    parsed = urlparse(settings.REDIS_URL)
+    
+    # rediss:// = TLS/SSL (Upstash, Redis Cloud, etc.); redis:// = local Docker, etc.
+    use_ssl = parsed.scheme == "rediss"
+    host = parsed.hostname or "localhost"
+    port = parsed.port or 6379
+    # Only the password is used (as before) - the username part of
+    # user:password@ is ignored so pre-ACL servers keep working
+    password = unquote(parsed.password) if parsed.password else None
+    try:
+        database = int(parsed.path.lstrip("/") or 0)
+    except ValueError:
+        database = 0
 
     logger.info(
         f"ARQ Redis settings: host={host}, port={port}, "
@@ -162,7 +186,8 @@ def get_arq_redis_settings() -> RedisSettings:
         conn_timeout=10,       # Timeout for initial connection (seconds)
         conn_retries=5,        # Number of retry attempts
         conn_retry_delay=1,    # Delay between retries (seconds)
-    )  
+    )
+
 
 # ============================================================
 # ARQ Connection Pool (for enqueueing tasks)
@@ -171,10 +196,11 @@ def get_arq_redis_settings() -> RedisSettings:
 # The worker process will pick them up and execute them.
 # ============================================================ 
  
-_arq_pool: Optional[ArqRedis] = None
+_arq_pool: Optional["ArqRedis"] = None
+_arq_pool_lock = asyncio.Lock()
 
 
-async def get_arq_pool() -> ArqRedis:
+async def get_arq_pool() -> "ArqRedis":
     """
     Get or create the ARQ Redis pool for enqueueing tasks.
     
@@ -185,8 +211,13 @@ async def get_arq_pool() -> ArqRedis:
     global _arq_pool
     
     if _arq_pool is None:
-        _arq_pool = await create_pool(get_arq_redis_settings())
-        logger.info("ARQ Redis pool created")
+        # Double-checked: concurrent first callers must not each create a pool
+        async with _arq_pool_lock:
+            if _arq_pool is None:
+                from arq.connections import create_pool
+                
+                _arq_pool = await create_pool(get_arq_redis_settings())
+                logger.info("ARQ Redis pool created")
     
     return _arq_pool
 
@@ -200,6 +231,60 @@ async def close_arq_pool():
         _arq_pool = None
         logger.info("ARQ Redis pool closed")
 
+# ============================================================
+# Rate Limiting
+# ============================================================
+
+class RateLimiter:
+    """
+    Fixed-window request counter keyed by client.
+    
+    Counts live in Redis (INCR + EXPIRE in one MULTI) so limits hold
+    across all uvicorn workers. If Redis is unreachable it falls back to
+    counting in this process, so a Redis outage doesn't disable the limit.
+    
+    Usage:
+        limiter = RateLimiter("shared", limit=30, window_seconds=60)
+        if not await limiter.hit(client_ip):
+            ...  # reject with 429
+    """
+    
+    def __init__(self, scope: str, limit: int, window_seconds: int = 60):
+        self.scope = scope
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._local_window = -1
+        self._local_counts: Dict[str, int] = {}
+    
+    async def hit(self, key: str) -> bool:
+        """Count a request for `key`; return False once it is over the limit."""
+        window = int(time.time() // self.window_seconds)
+        redis_key = f"ratelimit:{self.scope}:{key}:{window}"
+        
+        try:
+            redis = await get_redis()
+            # INCR and EXPIRE in one MULTI, so the key can't be left
+            # without a TTL. The key is per window, so re-arming the TTL
+            # on every hit only keeps it alive past the window's end.
+            async with redis.pipeline(transaction=True) as pipe:
+                pipe.incr(redis_key)
+                pipe.expire(redis_key, self.window_seconds)
+                count, _ = await pipe.execute()
+        except Exception:
+            count = self._local_hit(key, window)
+        
+        return count <= self.limit
+    
+    def _local_hit(self, key: str, window: int) -> int:
+        """In-process fallback counter (per worker)."""
+        if window != self._local_window:
+            self._local_window = window
+            self._local_counts = {}
+        count = self._local_counts.get(key, 0) + 1
+        self._local_counts[key] = count
+        return count
+
+
 # ============================================================
 # Health Check
 # ============================================================
@@ -221,4 +306,27 @@ async def check_redis_connection() -> bool:
         return response
     except Exception as e:
         logger.error(f"Redis health check failed: {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+async def warm_redis_pool(size: int) -> int:
+    """
+    Open up to `size` pool connections at startup with concurrent PINGs.
+    
+    Concurrent commands on the shared client each check out their own
+    connection, so this fills the pool before the first burst of traffic
+    instead of connecting one by one on demand.
+    
+    Returns:
+        Number of connections that answered PING
+    """
+    size = min(size, settings.REDIS_POOL_SIZE)
+    if size <= 0:
+        return 0
+    
+    redis = await get_redis()
+    results = await asyncio.gather(
+        *(redis.ping() for _ in range(size)),
+        return_exceptions=True,
+    )
+    return sum(1 for result in results if result is True)
@@ -29,32 +29,47 @@ ChromaDB can use its default or we provide our own.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Optional, Dict, Any, TypeVar, TYPE_CHECKING
 from uuid import UUID
 from pathlib import Path
 
-import chromadb
-from chromadb.config import Settings as ChromaSettings
-from chromadb.api.models.Collection import Collection
+import numpy as np
 
 from app.core.config import settings
 
 # Import for type checking only to avoid circular import
 # vector_store.py <- rag/__init__.py <- rag/pipeline.py <- vector_store.py
+# chromadb is heavy (onnxruntime, default embedder), so it is imported on
+# first client creation instead of at startup
 if TYPE_CHECKING:
+    import chromadb
+    from chromadb.api.models.Collection import Collection
     from app.ai.rag.chunker import TextChunk, ChunkMetadata
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Distance function for project collections. With cosine, Chroma returns
+# distance = 1 - cosine_similarity, so scores map straight onto [0, 1].
+COLLECTION_SPACE = "cosine"
+
 
 # ============================================================
 # CHROMADB CLIENT SINGLETON
 # ============================================================
 
-_chroma_client: Optional[chromadb.ClientAPI] = None
+_chroma_client: Optional["chromadb.ClientAPI"] = None
+_chroma_client_lock = threading.Lock()
 
 
-def get_chroma_client() -> chromadb.ClientAPI:
+def get_chroma_client() -> "chromadb.ClientAPI":
     """
     Get or create ChromaDB client (singleton).
     
@@ -63,6 +78,9 @@ def get_chroma_client() -> chromadb.ClientAPI:
     - If CHROMA_HOST is set: Connect to self-hosted remote server
     - Otherwise: Use persistent local storage
     
+    Thread-safe: callers in worker threads can race on first use, so
+    creation is guarded by a lock (double-checked).
+    
     Returns:
         ChromaDB client instance
     """
@@ -71,25 +89,37 @@ def get_chroma_client() -> chromadb.ClientAPI:
     if _chroma_client is not None:
         return _chroma_client
     
+    with _chroma_client_lock:
+        if _chroma_client is None:
+            _chroma_client = _create_chroma_client()
+    
+    return _chroma_client
+
+
+def _create_chroma_client() -> "chromadb.ClientAPI":
+    """Build a ChromaDB client for the configured mode."""
+    import chromadb
+    from chromadb.config import Settings as ChromaSettings
+    
     if settings.CHROMA_API_KEY:
         # ChromaDB Cloud mode
         logger.info("Connecting to ChromaDB Cloud...")
-        _chroma_client = chromadb.CloudClient(
+        client = chromadb.CloudClient(
             tenant=settings.CHROMA_TENANT,
             database=settings.CHROMA_DATABASE,
             api_key=settings.CHROMA_API_KEY,
         )
         logger.info(
-            f"ChromaDB Cloud connected "
-            f"(tenant: {settings.CHROMA_TENANT}, db: {settings.CHROMA_DATABASE})"
+            "ChromaDB Cloud connected (tenant: %s, db: %s)",
+            settings.CHROMA_TENANT, settings.CHROMA_DATABASE
         )
     elif settings.CHROMA_HOST:
         # Self-hosted remote server mode
         logger.info(
-            f"Connecting to ChromaDB server at "
-            f"{settings.CHROMA_HOST}:{settings.CHROMA_PORT}"
+            "Connecting to ChromaDB server at %s:%s",
+            settings.CHROMA_HOST, settings.CHROMA_PORT
         )
-        _chroma_client = chromadb.HttpClient(
+        client = chromadb.HttpClient(
             host=settings.CHROMA_HOST,
             port=settings.CHROMA_PORT
         )
@@ -99,9 +129,9 @@ def get_chroma_client() -> chromadb.ClientAPI:
         persist_path = Path(settings.CHROMA_PERSIST_DIRECTORY)
         persist_path.mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"Using persistent ChromaDB at {persist_path}")
+        logger.info("Using persistent ChromaDB at %s", persist_path)
         
-        _chroma_client = chromadb.PersistentClient(
+        client = chromadb.PersistentClient(
             path=str(persist_path),
             settings=ChromaSettings(
                 anonymized_telemetry=False,
@@ -110,7 +140,7 @@ def get_chroma_client() -> chromadb.ClientAPI:
         )
     
     logger.info("ChromaDB client initialized")
-    return _chroma_client
+    return client
 
 
 def reset_chroma_client() -> None:
@@ -119,6 +149,32 @@ def reset_chroma_client() -> None:
     _chroma_client = None
 
 
+@lru_cache(maxsize=1024)
+def _collection_name_for(project_id: UUID) -> str:
+    """Collection name for a project (UUID.hex is the hyphen-free form)."""
+    return f"project_{project_id.hex}"
+
+
+# Identical searches arrive in bursts (retries, re-renders, pagination),
+# so results are kept briefly. The TTL also bounds staleness when another
+# process (the worker) writes to the collection.
+_SEARCH_CACHE_MAXSIZE = 1000
+_SEARCH_CACHE_TTL_SECONDS = 5
+
+
+def _copy_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy search results down to their metadata dicts (values are scalars)."""
+    return [
+        {**r, "metadata": dict(r["metadata"]) if r["metadata"] is not None else None}
+        for r in results
+    ]
+
+
+# Temporary collection names used by migrate_collections_to_cosine
+_MIGRATION_COPY_SUFFIX = "_cosine"
+_MIGRATION_ASIDE_SUFFIX = "_l2old"
+
+
 # ============================================================
 # VECTOR STORE CLASS
 # ============================================================
@@ -160,6 +216,14 @@ class VectorStore:
     def __init__(self):
         """Initialize vector store with ChromaDB client."""
         self.client = get_chroma_client()
+        # Collection handles are thin references, safe to reuse; caching
+        # them skips a ChromaDB round trip per operation. A handle whose
+        # collection was dropped elsewhere is reloaded by _on_collection.
+        self._collection_cache: Dict[UUID, "Collection"] = {}
+        # key -> (expires_at, results); see _SEARCH_CACHE_TTL_SECONDS
+        self._search_cache: "OrderedDict[tuple, tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self._max_batch_size: Optional[int] = None
     
     # ============================================================
     # COLLECTION MANAGEMENT
@@ -176,15 +240,15 @@ class VectorStore:
         - Start and end with alphanumeric
         - Contain only alphanumeric, underscore, hyphen
         """
-        # Remove hyphens from UUID for cleaner name
-        clean_id = str(project_id).replace("-", "")
-        return f"project_{clean_id}"
+        if not isinstance(project_id, UUID):
+            project_id = UUID(str(project_id))
+        return _collection_name_for(project_id)
     
     def get_or_create_collection(
         self,
         project_id: UUID,
         embedding_function: Optional[Any] = None
-    ) -> Collection:
+    ) -> "Collection":
         """
         Get or create a collection for a project.
         
@@ -196,19 +260,47 @@ class VectorStore:
         Returns:
             ChromaDB Collection object
         """
+        # Handles bound to a custom embedding function aren't cached
+        if embedding_function is None:
+            cached = self._collection_cache.get(project_id)
+            if cached is not None:
+                return cached
+        
         collection_name = self._get_collection_name(project_id)
         
         # Get or create collection
         # If embedding_function is None, ChromaDB won't auto-embed
         collection = self.client.get_or_create_collection(
             name=collection_name,
-            metadata={"project_id": str(project_id)},
+            metadata={"project_id": str(project_id), "hnsw:space": COLLECTION_SPACE},
             embedding_function=embedding_function
         )
         
-        logger.debug(f"Got collection '{collection_name}'")
+        if embedding_function is None:
+            self._collection_cache[project_id] = collection
+        
+        logger.debug("Got collection '%s'", collection_name)
         return collection
     
+    def _on_collection(self, project_id: UUID, op: Callable[["Collection"], T]) -> T:
+        """
+        Run `op` on a project's collection, reloading a stale handle once.
+        
+        Cached handles point at a collection id. If another process
+        deleted or rebuilt the collection (e.g. the cosine migration),
+        Chroma raises NotFoundError; the handle is dropped and `op` is
+        retried with a fresh one from get_or_create_collection.
+        """
+        from chromadb.errors import NotFoundError
+        
+        try:
+            return op(self.get_or_create_collection(project_id))
+        except NotFoundError:
+            if self._collection_cache.pop(project_id, None) is None:
+                raise
+            logger.info("Collection handle for project %s is stale; reloading", project_id)
+            return op(self.get_or_create_collection(project_id))
+    
     def delete_collection(self, project_id: UUID) -> bool:
         """
         Delete a project's collection.
@@ -222,13 +314,15 @@ class VectorStore:
             True if deleted, False if didn't exist
         """
         collection_name = self._get_collection_name(project_id)
+        self._collection_cache.pop(project_id, None)
+        self._clear_search_cache()
         
         try:
             self.client.delete_collection(collection_name)
-            logger.info(f"Deleted collection '{collection_name}'")
+            logger.info("Deleted collection '%s'", collection_name)
             return True
         except Exception as e:
-            logger.debug(f"Collection '{collection_name}' not found: {e}")
+            logger.debug("Collection '%s' not found: %s", collection_name, e)
             return False
     
     def collection_exists(self, project_id: UUID) -> bool:
@@ -241,6 +335,110 @@ class VectorStore:
         except Exception:
             return False
     
+    def migrate_collections_to_cosine(self, batch_size: int = 500) -> int:
+        """
+        Rebuild legacy L2 project collections under cosine distance.
+        
+        One-time migration: Chroma can't change a collection's distance
+        function in place, so each L2 collection is copied (ids, embeddings,
+        documents, metadata) into `<name>_cosine`, the original is renamed
+        aside to `<name>_l2old`, the copy renamed into place, and only then
+        is the original dropped. A run that dies part way is finished by
+        the next one (see _recover_interrupted_migration), and collections
+        already on cosine are skipped, so running it again is safe.
+        
+        Other processes hold cached collection handles; they reload them
+        when a call hits the rebuilt collection (see _on_collection).
+        
+        Args:
+            batch_size: Records copied per get/add round trip
+        
+        Returns:
+            Number of collections rebuilt
+        """
+        migrated = 0
+        # Rebuilt collections get new ids, so cached handles go stale
+        self._collection_cache.clear()
+        self._clear_search_cache()
+        
+        self._recover_interrupted_migration()
+        
+        for collection in self.client.list_collections():
+            name = collection.name
+            metadata = dict(collection.metadata or {})
+            if not name.startswith("project_"):
+                continue
+            if name.endswith((_MIGRATION_COPY_SUFFIX, _MIGRATION_ASIDE_SUFFIX)):
+                continue
+            if metadata.get("hnsw:space", "l2") == COLLECTION_SPACE:
+                continue
+            
+            metadata["hnsw:space"] = COLLECTION_SPACE
+            copy_name = name + _MIGRATION_COPY_SUFFIX
+            # Partial copy from an interrupted run (the original still exists)
+            try:
+                self.client.delete_collection(copy_name)
+            except Exception:
+                pass
+            target = self.client.create_collection(name=copy_name, metadata=metadata)
+            
+            offset = 0
+            while True:
+                batch = collection.get(
+                    limit=batch_size,
+                    offset=offset,
+                    include=["embeddings", "documents", "metadatas"]
+                )
+                if not batch["ids"]:
+                    break
+                target.add(
+                    ids=batch["ids"],
+                    embeddings=batch["embeddings"],
+                    documents=batch["documents"],
+                    metadatas=batch["metadatas"]
+                )
+                offset += len(batch["ids"])
+            
+            # The copy is complete: swap it in, then drop the original
+            collection.modify(name=name + _MIGRATION_ASIDE_SUFFIX)
+            target.modify(name=name)
+            self.client.delete_collection(name + _MIGRATION_ASIDE_SUFFIX)
+            migrated += 1
+            logger.info("Rebuilt collection '%s' with cosine distance (%d chunks)", name, offset)
+        
+        return migrated
+    
+    def _recover_interrupted_migration(self) -> None:
+        """
+        Finish swaps left half-done by a migration run that died.
+        
+        A `<name>_cosine` copy whose `<name>` is gone is complete (the
+        original is only moved aside after the copy finishes), so it is
+        renamed into place. A leftover `<name>_l2old` is dropped once
+        `<name>` exists, or renamed back if there is nothing to replace it.
+        """
+        names = {c.name for c in self.client.list_collections()}
+        
+        for name in sorted(names):
+            if not name.startswith("project_") or not name.endswith(_MIGRATION_COPY_SUFFIX):
+                continue
+            base = name[:-len(_MIGRATION_COPY_SUFFIX)]
+            if base not in names:
+                self.client.get_collection(name).modify(name=base)
+                names.discard(name)
+                names.add(base)
+                logger.info("Finished interrupted rebuild of collection '%s'", base)
+        
+        for name in sorted(names):
+            if not name.startswith("project_") or not name.endswith(_MIGRATION_ASIDE_SUFFIX):
+                continue
+            base = name[:-len(_MIGRATION_ASIDE_SUFFIX)]
+            if base in names:
+                self.client.delete_collection(name)
+            else:
+                self.client.get_collection(name).modify(name=base)
+                logger.info("Restored collection '%s' from an interrupted rebuild", base)
+    
     # ============================================================
     # DOCUMENT OPERATIONS
     # ============================================================
@@ -275,95 +473,123 @@ class VectorStore:
             logger.warning("No chunks to add")
             return 0
         
-        collection = self.get_or_create_collection(project_id)
+        # One contiguous float32 matrix instead of lists of Python floats:
+        # half the memory, and Chroma takes it without per-float unboxing
+        embedding_matrix = np.asarray(embeddings, dtype=np.float32)
+        if embedding_matrix.ndim != 2:
+            raise ValueError("Embeddings must all have the same dimension")
+        
+        # Prepare data for ChromaDB in a single pass.
+        # Metadata values must be str, int, float, or bool (no nesting),
+        # so our metadata structure is flattened here.
+        ids: List[str] = []
+        documents: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+        add_id, add_document, add_metadata = ids.append, documents.append, metadatas.append
+        
+        for chunk in chunks:
+            meta = chunk.metadata
+            add_id(str(chunk.id))
+            add_document(chunk.text)
+            add_metadata({
+                "document_id": str(meta.document_id) if meta.document_id else "",
+                "document_name": meta.document_name or "",
+                "page_number": meta.page_number or 0,
+                "chunk_index": meta.chunk_index,
+                "total_chunks": meta.total_chunks,
+                "tokens": chunk.tokens,
+            })
         
-        # Prepare data for ChromaDB
-        ids = [str(chunk.id) for chunk in chunks]
-        documents = [chunk.text for chunk in chunks]
-        metadatas = [self._prepare_metadata(chunk) for chunk in chunks]
+        # Add to collection in shards: Chroma rejects a single add larger
+        # than the client's max batch size, and big uploads can insert
+        # shards in parallel (see VECTOR_ADD_PARALLEL_THRESHOLD)
+        total = len(ids)
+        threshold = settings.VECTOR_ADD_PARALLEL_THRESHOLD
+        workers = 1
+        if threshold and total > threshold:
+            workers = min(4, os.cpu_count() or 1)
+        shard_size = min(self._get_max_batch_size(), -(-total // workers))
+        
+        starts = range(0, total, shard_size)
+        
+        def add_all(collection: "Collection") -> str:
+            def add_shard(start: int) -> None:
+                end = start + shard_size
+                collection.add(
+                    ids=ids[start:end],
+                    embeddings=embedding_matrix[start:end],
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end]
+                )
+            
+            if workers > 1 and len(starts) > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(add_shard, starts))
+            else:
+                for start in starts:
+                    add_shard(start)
+            return collection.name
         
-        # Add to collection
-        # ChromaDB handles batching internally
-        collection.add(
-            ids=ids,
-            embeddings=embeddings,
-            documents=documents,
-            metadatas=metadatas
-        )
+        collection_name = self._on_collection(project_id, add_all)
+        self._clear_search_cache()
         
-        logger.info(
-            f"Added {len(chunks)} chunks to collection "
-            f"'{collection.name}'"
-        )
+        logger.info("Added %d chunks to collection '%s'", len(chunks), collection_name)
         return len(chunks)
     
-    def _prepare_metadata(self, chunk: "TextChunk") -> Dict[str, Any]:
-        """
-        Prepare chunk metadata for ChromaDB.
-        
-        ChromaDB metadata values must be:
-        - str, int, float, or bool
-        - No nested dicts or lists
-        
-        We flatten our metadata structure.
-        """
-        meta = chunk.metadata
-        return {
-            "document_id": str(meta.document_id) if meta.document_id else "",
-            "document_name": meta.document_name or "",
-            "page_number": meta.page_number or 0,
-            "chunk_index": meta.chunk_index,
-            "total_chunks": meta.total_chunks,
-            "tokens": chunk.tokens,
-        }
+    def _get_max_batch_size(self) -> int:
+        """Largest add Chroma accepts in one call (asked once per client)."""
+        if self._max_batch_size is None:
+            self._max_batch_size = self.client.get_max_batch_size()
+        return self._max_batch_size
     
     def delete_by_document(
         self,
         document_id: UUID,
-        project_id: UUID
-    ) -> int:
+        project_id: UUID,
+        return_count: bool = False
+    ) -> Optional[int]:
         """
         Delete all chunks for a document.
         
         Called when a document is deleted.
         
+        The delete is a single where-filtered call, so chunk IDs are never
+        fetched. Counting the chunks costs an extra round trip and is only
+        done when asked for.
+        
         Args:
             document_id: Document UUID
             project_id: Project UUID
+            return_count: Count the chunks before deleting them
         
         Returns:
-            Number of chunks deleted
-        """
-        collection = self.get_or_create_collection(project_id)
+            Number of chunks deleted if return_count, else None
         
-        # Find chunks belonging to this document
-        # ChromaDB where filter syntax
+        Raises:
+            Exception: If the vector store call fails
+        """
         try:
-            # Get IDs of chunks to delete
-            results = collection.get(
-                where={"document_id": str(document_id)},
-                include=[]  # Don't need content, just IDs
+            count = (
+                self.count_document_chunks(document_id, project_id)
+                if return_count else None
             )
-            
-            if not results['ids']:
-                logger.debug(f"No chunks found for document {document_id}")
-                return 0
-            
-            # Delete by IDs
-            collection.delete(ids=results['ids'])
-            
-            count = len(results['ids'])
-            logger.info(f"Deleted {count} chunks for document {document_id}")
+            self._on_collection(
+                project_id,
+                lambda collection: collection.delete(where={"document_id": str(document_id)})
+            )
+            self._clear_search_cache()
+            logger.info("Deleted chunks for document %s", document_id)
             return count
             
         except Exception as e:
-            logger.error(f"Error deleting chunks: {e}")
-            return 0
+            logger.error("Error deleting chunks: %s", e)
+            raise
     
     def get_document_chunks(
         self,
         document_id: UUID,
-        project_id: UUID
+        project_id: UUID,
+        include_embeddings: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Get all chunks for a document.
@@ -376,25 +602,36 @@ class VectorStore:
         Args:
             document_id: Document UUID
             project_id: Project UUID
+            include_embeddings: Also return each chunk's vector (large;
+                only fetched when asked for)
         
         Returns:
-            List of chunk data with text and metadata
+            List of chunk data with text and metadata (and "embedding"
+            if include_embeddings)
         """
-        collection = self.get_or_create_collection(project_id)
+        include = ["documents", "metadatas"]
+        if include_embeddings:
+            include.append("embeddings")
         
-        results = collection.get(
-            where={"document_id": str(document_id)},
-            include=["documents", "metadatas", "embeddings"]
+        results = self._on_collection(
+            project_id,
+            lambda collection: collection.get(
+                where={"document_id": str(document_id)},
+                include=include
+            )
         )
         
         chunks = []
         for i, doc_id in enumerate(results['ids']):
-            chunks.append({
+            chunk = {
                 "id": doc_id,
                 "text": results['documents'][i] if results['documents'] else None,
                 "metadata": results['metadatas'][i] if results['metadatas'] else None,
-                "embedding": results['embeddings'][i] if results.get('embeddings') else None,
-            })
+            }
+            if include_embeddings:
+                embeddings = results.get('embeddings')
+                chunk["embedding"] = embeddings[i] if embeddings is not None else None
+            chunks.append(chunk)
         
         return chunks
     
@@ -420,7 +657,7 @@ class VectorStore:
             project_id: Project to search in
             top_k: Maximum number of results
             document_ids: Optional filter to specific documents
-            min_score: Minimum similarity score (0-1)
+            min_score: Minimum cosine similarity (0-1)
         
         Returns:
             List of results with text, metadata, and score
@@ -441,7 +678,20 @@ class VectorStore:
                 print(f"Text: {r['text'][:100]}...")
                 print(f"Source: {r['metadata']['document_name']}, page {r['metadata']['page_number']}")
         """
-        collection = self.get_or_create_collection(project_id)
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        
+        cache_key = None
+        if settings.VECTOR_SEARCH_CACHE_ENABLED:
+            cache_key = (
+                query_vector.tobytes(),
+                project_id,
+                top_k,
+                tuple(sorted(map(str, document_ids or ()))),
+                min_score,
+            )
+            cached = self._get_cached_search(cache_key)
+            if cached is not None:
+                return cached
         
         # Build where filter
         where_filter = None
@@ -453,13 +703,17 @@ class VectorStore:
             else:
                 where_filter = {"document_id": {"$in": doc_id_strs}}
         
-        # Query collection
-        results = collection.query(
-            query_embeddings=[query_embedding],
-            n_results=top_k,
-            where=where_filter,
-            include=["documents", "metadatas", "distances"]
-        )
+        # Query collection (and note its distance function for scoring)
+        def query(collection: "Collection"):
+            results = collection.query(
+                query_embeddings=query_vector[np.newaxis, :],
+                n_results=top_k,
+                where=where_filter,
+                include=["documents", "metadatas", "distances"]
+            )
+            return results, (collection.metadata or {}).get("hnsw:space", "l2")
+        
+        results, space = self._on_collection(project_id, query)
         
         # Process results
         # ChromaDB returns distances; we convert to similarity scores
@@ -468,33 +722,68 @@ class VectorStore:
         if not results['ids'] or not results['ids'][0]:
             return []
         
-        for i, chunk_id in enumerate(results['ids'][0]):
-            # ChromaDB uses L2 distance by default
-            # Convert to similarity score (closer = higher score)
-            distance = results['distances'][0][i]
-            # Simple conversion: similarity = 1 / (1 + distance)
-            # Higher is better
-            similarity = 1 / (1 + distance)
-            
-            if similarity < min_score:
-                continue
-            
+        ids = results['ids'][0]
+        texts = results['documents'][0]
+        metadatas = results['metadatas'][0]
+        distances = np.asarray(results['distances'][0], dtype=np.float64)
+        
+        # Cosine collections: similarity = 1 - distance, clipped to [0, 1].
+        # Collections created before the switch are still L2 until
+        # migrate_collections_to_cosine() runs; keep their old 1/(1+d) score.
+        if space == COLLECTION_SPACE:
+            similarities = np.clip(1.0 - distances, 0.0, 1.0)
+        else:
+            similarities = 1.0 / (1.0 + distances)
+        
+        for i in np.flatnonzero(similarities >= min_score):
             search_results.append({
-                "id": chunk_id,
-                "text": results['documents'][0][i],
-                "metadata": results['metadatas'][0][i],
-                "score": similarity,
-                "distance": distance,
+                "id": ids[i],
+                "text": texts[i],
+                "metadata": metadatas[i],
+                "score": float(similarities[i]),
+                "distance": float(distances[i]),
             })
         
-        top_score = search_results[0]['score'] if search_results else 0
-        logger.debug(
-            f"Search returned {len(search_results)} results "
-            f"(top score: {top_score:.3f})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Search returned %d results (top score: %.3f)",
+                len(search_results),
+                search_results[0]['score'] if search_results else 0.0
+            )
+        
+        if cache_key is not None:
+            self._store_cached_search(cache_key, search_results)
         
         return search_results
     
+    def _get_cached_search(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of a live cached search result, or None."""
+        with self._search_cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+            return _copy_results(entry[1])
+    
+    def _store_cached_search(self, key: tuple, results: List[Dict[str, Any]]) -> None:
+        # Stored as a private copy so callers mutating their results
+        # (e.g. re-scoring) can't change what later hits see
+        with self._search_cache_lock:
+            self._search_cache[key] = (
+                time.monotonic() + _SEARCH_CACHE_TTL_SECONDS,
+                _copy_results(results),
+            )
+            if len(self._search_cache) > _SEARCH_CACHE_MAXSIZE:
+                self._search_cache.popitem(last=False)
+    
+    def _clear_search_cache(self) -> None:
+        """Drop cached searches after this process writes to a collection."""
+        with self._search_cache_lock:
+            self._search_cache.clear()
+    
     def search_with_text(
         self,
         query_text: str,
@@ -539,18 +828,18 @@ class VectorStore:
         Returns:
             Dictionary with count, metadata, etc.
         """
-        collection = self.get_or_create_collection(project_id)
-        
-        return {
-            "name": collection.name,
-            "count": collection.count(),
-            "metadata": collection.metadata,
-        }
+        return self._on_collection(
+            project_id,
+            lambda collection: {
+                "name": collection.name,
+                "count": collection.count(),
+                "metadata": collection.metadata,
+            }
+        )
     
     def count_chunks(self, project_id: UUID) -> int:
         """Count total chunks in a project's collection."""
-        collection = self.get_or_create_collection(project_id)
-        return collection.count()
+        return self._on_collection(project_id, lambda collection: collection.count())
     
     def count_document_chunks(
         self,
@@ -558,11 +847,12 @@ class VectorStore:
         project_id: UUID
     ) -> int:
         """Count chunks for a specific document."""
-        collection = self.get_or_create_collection(project_id)
-        
-        results = collection.get(
-            where={"document_id": str(document_id)},
-            include=[]
+        results = self._on_collection(
+            project_id,
+            lambda collection: collection.get(
+                where={"document_id": str(document_id)},
+                include=[]
+            )
         )
         
         return len(results['ids'])
@@ -573,14 +863,17 @@ class VectorStore:
 # ============================================================
 
 _vector_store: Optional[VectorStore] = None
+_vector_store_lock = threading.Lock()
 
 
 def get_vector_store() -> VectorStore:
-    """Get or create VectorStore singleton."""
+    """Get or create VectorStore singleton (thread-safe)."""
     global _vector_store
     
     if _vector_store is None:
-        _vector_store = VectorStore()
+        with _vector_store_lock:
+            if _vector_store is None:
+                _vector_store = VectorStore()
     
     return _vector_store
 
@@ -611,5 +904,5 @@ def check_vector_store_health() -> bool:
         client.list_collections()
         return True
     except Exception as e:
-        logger.error(f"Vector store health check failed: {e}")
+        logger.error("Vector store health check failed: %s", e)
         return False
\ No newline at end of file
@@ -7,92 +7,182 @@ This module initializes the FastAPI application with:
 - Route registration
 - Health check endpoints
 """
+import asyncio
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from typing import Optional
+
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy.orm import configure_mappers
+from starlette.applications import Starlette
+from starlette.routing import Route
 
 from app.core.config import settings
-from app.db.database import check_db_connection
+from app.core.logging_setup import setup_logging
+
+# Configure logging before the app imports below, which log at import time
+setup_logging(settings.LOG_LEVEL)
+
+from app.core.security import apply_bcrypt_calibration
+from app.db.database import check_db_connection, pool_limits, warm_connection_pool
 from app.db.redis import (
     check_redis_connection,
+    get_redis,
     get_redis_pool,
+    warm_redis_pool,
     close_redis_pool,
     close_arq_pool,
 )
 from app.services.websocket_manager import shutdown_connection_manager
+from app.services.sharing_service import flush_share_views
 from app.db.vector_store import check_vector_store_health
 from app.ai.rag import warmup_model
 from app.middleware.logging import LoggingMiddleware
+from app.middleware.request_id import RequestIDMiddleware
+from app.middleware.health import HealthProbeMiddleware
 from app.api.v1.router import api_router
+from app import models  # noqa: F401 - every mapper registered before configure_mappers()
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
 # ============================================================
 # Application Lifespan Events
 # ============================================================
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """
-    Lifespan context manager for startup and shutdown events.
-    
-    Startup:
-    - Check database connection
-    - Initialize Redis connection pool
-    
-    Shutdown:
-    - Close Redis connections
-    """
-    # ========== STARTUP ==========
-    logger.info(f"Starting {settings.PROJECT_NAME}...")
-    logger.info(f"Debug mode: {settings.DEBUG}")
-    
-    # Check database connection on startup
+async def _warm_model_bg(app: FastAPI) -> None:
+    """Warm up the embedding model off the startup path."""
+    try:
+        model_info = await asyncio.to_thread(warmup_model)
+        logger.info(f"Embedding model loaded: {model_info['name']}")
+        app.state.model_ready.set()
+    except Exception as e:
+        logger.warning(f"Failed to warm up embedding model: {e}")
+
+
+async def _calibrate_bcrypt() -> None:
+    """Tune bcrypt cost to this host (opt-in via BCRYPT_TARGET_MS)."""
+    if settings.BCRYPT_TARGET_MS:
+        rounds = await asyncio.to_thread(apply_bcrypt_calibration, settings.BCRYPT_TARGET_MS)
+        logger.info(f"bcrypt rounds calibrated to {rounds} (target {settings.BCRYPT_TARGET_MS}ms)")
+
+
+async def _startup_db() -> None:
+    """Check the database connection and warm the pool."""
     try:
         db_healthy = await check_db_connection()
         if db_healthy:
             logger.info("Database connection established successfully")
+            pool_size, max_overflow = pool_limits()
+            logger.info(
+                f"Database pool: size={pool_size}, max_overflow={max_overflow}, "
+                f"timeout={settings.DB_POOL_TIMEOUT}s"
+            )
+            warmed = await warm_connection_pool(settings.DB_POOL_WARM_SIZE)
+            logger.info(f"Database pool warmed with {warmed} connections")
         else:
             logger.warning("Database connection check failed")
     except Exception as e:
         logger.error(f"Database connection error on startup: {e}")
-    
-    # Initialize Redis connection pool
+
+
+async def _startup_redis() -> None:
+    """Initialize the Redis connection pool and warm it."""
     try:
         get_redis_pool()  # Creates the pool (singleton)
         redis_healthy = await check_redis_connection()
         if redis_healthy:
             logger.info("Redis connection established successfully")
+            warmed = await warm_redis_pool(settings.REDIS_POOL_WARM_SIZE)
+            logger.info(f"Redis pool warmed with {warmed} connections")
         else:
             logger.warning("Redis connection check failed - background tasks may not work")
     except Exception as e:
         logger.error(f"Redis connection error on startup: {e}")
         # Don't fail startup - app can work without Redis (just no background tasks)
 
+
+async def _periodic_share_view_flush() -> None:
+    """Apply Redis-buffered share views to the DB every SHARE_VIEW_FLUSH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(settings.SHARE_VIEW_FLUSH_INTERVAL)
+        try:
+            await flush_share_views(await get_redis())
+        except Exception as e:
+            logger.warning(f"Share view flush failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context manager for startup and shutdown events.
+    
+    Startup:
+    - Check database connection
+    - Initialize Redis connection pool
+    
+    Shutdown:
+    - Close Redis connections
+    """
+    # ========== STARTUP ==========
+    logger.info(f"Starting {settings.PROJECT_NAME}...")
+    logger.info(f"Debug mode: {settings.DEBUG}")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__module__}")
+    
+    # Resolve all relationship() strings/backrefs now instead of on the
+    # first query of the first request
+    configure_mappers()
+    
+    # Independent startup steps run concurrently: startup takes as long as
+    # the slowest step rather than the sum
+    await asyncio.gather(_calibrate_bcrypt(), _startup_db(), _startup_redis())
+
+    # Embedding warmup is a network round trip to Gemini; run it in the
+    # background so the server starts answering /health immediately
+    app.state.model_ready = asyncio.Event()
+    app.state.model_warmup_task = asyncio.create_task(_warm_model_bg(app))
+    
+    # Dependencies are probed on a timer; /health serves the latest snapshot.
+    # The first run is awaited here (bounded by the probe timeouts) so
+    # /health has a real payload as soon as the server accepts requests.
+    app.state.health_snapshot = None
     try:
-        model_info = warmup_model()
-        logger.info(f"Embedding model loaded: {model_info['name']}")
+        app.state.health_snapshot = await _run_health_checks()
     except Exception as e:
-        logger.warning(f"Failed to warm up embedding model: {e}")    
+        logger.error(f"Initial health probe failed: {e}")
+    app.state.health_task = asyncio.create_task(_periodic_health(app))
+    
+    # Production runs no ARQ worker, so the web process flushes the
+    # buffered share view counts itself
+    app.state.share_view_flush_task = asyncio.create_task(_periodic_share_view_flush())
     
     yield  # Application runs here
     
     # ========== SHUTDOWN ==========
     logger.info(f"Shutting down {settings.PROJECT_NAME}...")
     
+    app.state.model_warmup_task.cancel()
+    app.state.health_task.cancel()
+    app.state.share_view_flush_task.cancel()
+    
     # Close WebSocket connections
     await shutdown_connection_manager()
     
-    # Close Redis connections
-    await close_redis_pool()
-    await close_arq_pool()
+    # Close Redis connections concurrently, bounded so a hung close can't
+    # hold the process past the platform's termination grace period
+    try:
+        results = await asyncio.wait_for(
+            asyncio.gather(close_redis_pool(), close_arq_pool(), return_exceptions=True),
+            timeout=settings.SHUTDOWN_TIMEOUT,
+        )
+        for name, result in zip(("Redis pool", "ARQ pool"), results):
+            if isinstance(result, Exception):
+                logger.error(f"Error closing {name}: {result}")
+    except asyncio.TimeoutError:
+        logger.error(f"Closing Redis pools timed out after {settings.SHUTDOWN_TIMEOUT}s")
     
     logger.info("Shutdown complete")
 
@@ -114,9 +204,12 @@ app = FastAPI(
     - Progress Tracking
     """,
     version="1.0.0",
-    openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    # Schema and docs only in debug: the schema walks every route/model on
+    # first access and stays cached, and prod has no use for it
+    openapi_url=f"{settings.API_V1_PREFIX}/openapi.json" if settings.DEBUG else None,
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,  # orjson encodes responses
     lifespan=lifespan
 )
 
@@ -135,24 +228,140 @@ app.add_middleware(
 if settings.DEBUG:
     app.add_middleware(LoggingMiddleware)
 
+# Added last so it is outermost and every response carries X-Request-ID
+app.add_middleware(RequestIDMiddleware)
+
 
 # ----------------------------------------------------
 # Health Check Endpoints
 # ----------------------------------------------------
-@app.get("/", tags=["Health"])
+# Probes for load balancers/monitoring - kept out of the OpenAPI schema
+# Fixed for the life of the process, so it is encoded once. A fresh
+# Response is still built per request: middleware (CORS) appends to a
+# response's header list, so a shared instance would accumulate headers.
+_ROOT_BYTES = orjson.dumps({
+    "name": settings.PROJECT_NAME,
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/docs" if settings.DEBUG else "disabled"
+})
+
+
+@app.get("/", tags=["Health"], include_in_schema=False)
 async def root():
     """Root endpoint with API information."""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+
+
+# Per-probe budgets (seconds): a stalled connection reports
+# "disconnected" instead of holding a probe run for a full socket timeout
+_DB_PROBE_TIMEOUT = 0.5
+_REDIS_PROBE_TIMEOUT = 0.3
+_VECTOR_PROBE_TIMEOUT = 0.5
+
+# The vector check is synchronous. It runs on its own single thread so a
+# hung Chroma pins that one thread instead of leaking a default-executor
+# thread per probe: while a check is still running no new one is started,
+# later probes wait on the one in flight.
+_vector_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="health-vector")
+_vector_probe: Optional[Future] = None
+_vector_probe_completed = False
+
+
+async def _probe(awaitable, timeout: float) -> bool:
+    """Await a health probe; timeouts and errors count as unhealthy."""
+    try:
+        return bool(await asyncio.wait_for(awaitable, timeout))
+    except Exception:
+        return False
+
+
+async def _probe_vector_store() -> Optional[bool]:
+    """
+    Check the vector store on the dedicated probe thread.
+    
+    Returns None while the first check is still running (it includes the
+    lazy chromadb import), so a cold start reports "starting" rather than
+    "disconnected".
+    """
+    global _vector_probe
+    if _vector_probe is None or _vector_probe.done():
+        _vector_probe = _vector_executor.submit(check_vector_store_health)
+        _vector_probe.add_done_callback(_mark_vector_probe_completed)
+    try:
+        return bool(await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(_vector_probe)), _VECTOR_PROBE_TIMEOUT
+        ))
+    except asyncio.TimeoutError:
+        return False if _vector_probe_completed else None
+    except Exception:
+        return False
+
+
+def _mark_vector_probe_completed(future: Future) -> None:
+    global _vector_probe_completed
+    _vector_probe_completed = True
+
+
+def _model_status() -> str:
+    """Embedding warmup state: ready, loading, or unavailable (warmup failed)."""
+    ready = getattr(app.state, "model_ready", None)
+    if ready is not None and ready.is_set():
+        return "ready"
+    task = getattr(app.state, "model_warmup_task", None)
+    if task is not None and not task.done():
+        return "loading"
+    return "unavailable"
+
+
+async def _run_health_checks() -> dict:
+    """Probe every dependency and build the /health payload."""
+    # Probes run concurrently, so a run takes as long as the slowest one,
+    # not the sum
+    db_healthy, redis_healthy, vector_healthy = await asyncio.gather(
+        _probe(check_db_connection(), _DB_PROBE_TIMEOUT),
+        _probe(check_redis_connection(), _REDIS_PROBE_TIMEOUT),
+        _probe_vector_store(),
+    )
+    
+    status = "healthy"
+    if not db_healthy or not redis_healthy:
+        status = "degraded"
+    if vector_healthy is False:
+        status = "degraded"
+    
+    if vector_healthy is None:
+        vector_status = "starting"
+    else:
+        vector_status = "connected" if vector_healthy else "disconnected"
+    
     return {
-        "name": settings.PROJECT_NAME,
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/docs" if settings.DEBUG else "disabled"
-    }    
+        "status": status,
+        "database": "connected" if db_healthy else "disconnected",
+        "redis": "connected" if redis_healthy else "disconnected",
+        "vector_store": vector_status,
+        "model": _model_status(),
+    }
+
 
+async def _periodic_health(app: FastAPI) -> None:
+    """Refresh app.state.health_snapshot every HEALTH_PROBE_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(settings.HEALTH_PROBE_INTERVAL)
+        try:
+            app.state.health_snapshot = await _run_health_checks()
+        except Exception as e:
+            logger.error(f"Background health probe failed: {e}")
 
 
-@app.get("/health", tags=["Health"])
-async def health_check():
+def _health_snapshot() -> dict:
+    """Latest background probe result ("starting" before the first lands)."""
+    snapshot = getattr(app.state, "health_snapshot", None)
+    return snapshot if snapshot is not None else {"status": "starting"}
+
+
+async def health_check(request):
     """
     Health check endpoint for monitoring.
     
@@ -160,33 +369,29 @@ async def health_check():
     - Database connectivity
     - Redis connectivity
     - Vector store connectivity
+    
+    Served by a bare Starlette app (see HealthProbeMiddleware) from the
+    background probe's latest snapshot; nothing is probed per request.
     """
-    try:
-        db_healthy = await check_db_connection()
-        redis_healthy = await check_redis_connection()
-        vector_healthy = check_vector_store_health()
-        
-        status = "healthy"
-        if not db_healthy or not redis_healthy:
-            status = "degraded"
-        if not vector_healthy:
-            status = "degraded"
-        
-        return {
-            "status": status,
-            "database": "connected" if db_healthy else "disconnected",
-            "redis": "connected" if redis_healthy else "disconnected",
-            "vector_store": "connected" if vector_healthy else "disconnected",
-        }
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return JSONResponse(
-            status_code=503,
-            content={
-                "status": "unhealthy",
-                "error": str(e)
-            }
-        ) 
+    return ORJSONResponse(_health_snapshot())
+
+
+@app.get("/health/deep", tags=["Health"], include_in_schema=False)
+async def health_check_deep():
+    """
+    Health check through the full middleware stack.
+    
+    Serves the same snapshot as /health, but the request goes through
+    CORS, logging, request-ID and the router, so it also exercises those.
+    """
+    return _health_snapshot()
+
+
+health_app = Starlette(routes=[Route("/health", health_check, methods=["GET"])])
+
+# Added after every other middleware so it is outermost: /health probes
+# never enter CORS, logging, request-ID or the API router
+app.add_middleware(HealthProbeMiddleware, path="/health", probe_app=health_app)
 
 # ============================================================
 # Include API Router
@@ -200,20 +405,20 @@ app.include_router(
 # ----------------------------------------------------
 # Exception Handlers
 # ----------------------------------------------------
+# Starlette already dispatches these with a dict lookup by status code;
+# the fixed bodies are encoded once (fresh Response per call, see root)
+_NOT_FOUND_BODY = orjson.dumps({"detail": "Not found"})
+_INTERNAL_ERROR_BODY = orjson.dumps({"detail": "Internal server error"})
+
+
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """Handle 404 errors."""
-    return JSONResponse(
-        status_code=404,
-        content={"detail": "Not found"}
-    )
+    return Response(content=_NOT_FOUND_BODY, status_code=404, media_type="application/json")
 
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     """Handle 500 errors."""
     logger.error(f"Internal server error: {exc}")
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal server error"}
-    )
\ No newline at end of file
+    return Response(content=_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
@@ -0,0 +1,26 @@
+"""
+Health Probe Middleware
+
+Load balancers and k8s probes hit /health every few seconds. This pure
+ASGI middleware sits outermost and hands exactly that path to a bare
+probe app, so probes skip CORS, logging, request IDs, exception
+handlers and the API router entirely. Every other request passes
+through untouched.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class HealthProbeMiddleware:
+    """Route `path` to `probe_app`, everything else to the wrapped app."""
+
+    def __init__(self, app: ASGIApp, path: str, probe_app: ASGIApp):
+        self.app = app
+        self.path = path
+        self.probe_app = probe_app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and scope["path"] == self.path:
+            await self.probe_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
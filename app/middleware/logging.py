@@ -9,6 +9,8 @@ import logging
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.middleware.request_id import get_request_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,7 +23,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         
         # Log request
         logger.info(
-            f"{request.method} {request.url.path} - "
+            f"[{get_request_id()}] {request.method} {request.url.path} - "
             f"Client: {request.client.host if request.client else 'unknown'}"
         )
         
@@ -33,7 +35,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         
         # Log response
         logger.info(
-            f"{request.method} {request.url.path} - "
+            f"[{get_request_id()}] {request.method} {request.url.path} - "
             f"Status: {response.status_code} - "
             f"Duration: {duration:.3f}s"
         )
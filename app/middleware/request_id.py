@@ -0,0 +1,64 @@
+"""
+Request ID Middleware
+
+Tags every HTTP request with an X-Request-ID so log lines and client
+reports can be correlated. An incoming X-Request-ID (e.g. from the load
+balancer) is reused; otherwise a new one is generated.
+
+The ID is stored in a ContextVar, so any code running inside the request
+can read it with get_request_id() without threading it through calls.
+"""
+
+import uuid
+from contextvars import ContextVar
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Longer incoming IDs are ignored so clients can't bloat logs/headers
+MAX_REQUEST_ID_LENGTH = 128
+
+request_id_ctx: ContextVar[str] = ContextVar("request_id", default="-")
+
+
+def get_request_id() -> str:
+    """Return the current request's ID ("-" outside a request)."""
+    return request_id_ctx.get()
+
+
+class RequestIDMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware) so it adds no extra
+    task or body buffering per request - it only wraps `send` to add the
+    response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")
+                break
+        if not request_id or len(request_id) > MAX_REQUEST_ID_LENGTH:
+            request_id = uuid.uuid4().hex
+
+        token = request_id_ctx.set(request_id)
+        header = (REQUEST_ID_HEADER, request_id.encode("latin-1"))
+
+        async def send_with_request_id(message: Message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), header]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_ctx.reset(token)
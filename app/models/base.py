@@ -29,14 +29,22 @@ class BaseModel(Base):
     # This makes the class abstract - no table will be created for BaseModel itself
     __abstract__ = True
     
-    # Primary Key - UUID for better security and distributed systems
+    # Return server-generated values (created_at, updated_at) in the
+    # INSERT/UPDATE RETURNING clause instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
+    # Primary Key - UUID for better security and distributed systems.
+    # Generated client-side so the ORM can use it as the insert sentinel:
+    # a flush of many rows then goes out as batched multi-row INSERTs
+    # (a server-only default forces one INSERT per row). The server
+    # default still covers rows inserted outside the ORM.
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,  
+        default=uuid.uuid4,
         server_default=func.gen_random_uuid(),  
         nullable=False,
-        index=True
+        insert_sentinel=True
     )
     
     # Created timestamp - set once when record is created
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, ForeignKey
+from sqlalchemy import Column, String, Boolean, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from .base import BaseModel
@@ -6,12 +6,27 @@ from .base import BaseModel
 class Conversation(BaseModel):
     __tablename__ = "conversations"
     
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=True, index=True) 
     title = Column(String(200), nullable=True)
     is_socratic = Column(Boolean, default=True, nullable=False)
     
+    # Conversation lists: WHERE user_id = ? [AND project_id = ? | IS NULL]
+    # ORDER BY updated_at DESC. Each shape gets an index that returns rows
+    # already in order; the user_id-leading ones also cover plain user_id lookups.
+    __table_args__ = (
+        Index("ix_conversations_user_id_updated_at", "user_id", text("updated_at DESC")),
+        Index("ix_conversations_user_id_project_id_updated_at", "user_id", "project_id", text("updated_at DESC")),
+        Index(
+            "ix_conversations_quick_chats",
+            "user_id", text("updated_at DESC"),
+            postgresql_where=text("project_id IS NULL"),
+        ),
+    )
+    
     # Relationships
+    # Collections marked lazy="raise" must be loaded explicitly in the
+    # repository (selectinload), so an accidental per-row load fails loudly
     user = relationship("User", back_populates="conversations")
     project = relationship("Project", back_populates="conversations")
-    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan", order_by="Message.created_at")
\ No newline at end of file
+    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan", order_by="Message.created_at", lazy="raise")
\ No newline at end of file
@@ -1,14 +1,14 @@
 from sqlalchemy import Column, String, Integer, Float, ForeignKey, DateTime
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 from .base import BaseModel
 
 class KnowledgeState(BaseModel):
     __tablename__ = "knowledge_states"
     
     # Foreign Keys - Who knows what?
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=True, index=True)
     topic_id = Column(UUID(as_uuid=True), ForeignKey("topics.id", ondelete="CASCADE"), nullable=True, index=True)
     subtopic_id = Column(UUID(as_uuid=True), ForeignKey("subtopics.id", ondelete="CASCADE"), nullable=True, index=True)
@@ -23,9 +23,12 @@ class KnowledgeState(BaseModel):
     misconceptions = Column(JSONB, default={}, nullable=False)
     last_reviewed = Column(DateTime(timezone=True), nullable=True)
     
-    # Unique constraint
+    # The unique constraint's index also serves user_id and
+    # (user_id, project_id) lookups; mastery-by-topic filters on
+    # (user_id, topic_id), which it can't cover
     __table_args__ = (
         UniqueConstraint('user_id', 'project_id', 'topic_id', 'subtopic_id', name='uq_user_project_topic_subtopic'),
+        Index('ix_knowledge_states_user_id_topic_id', 'user_id', 'topic_id'),
     )
     
     # Relationships
@@ -16,7 +16,7 @@ class MessageRole(enum.Enum):
 class Message(Base):
     __tablename__ = "messages"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False, index=True)
     role = Column(
         Enum(MessageRole, name="message_role", values_callable=lambda x: [e.value for e in x]), 
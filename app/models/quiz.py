@@ -13,7 +13,7 @@ class QuizDifficulty(enum.Enum):
 class Quiz(Base):
     __tablename__ = "quizzes"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Quiz info
@@ -48,5 +48,5 @@ class Quiz(Base):
     
     # Relationships
     project = relationship("Project", back_populates="quizzes")
-    questions = relationship("QuizQuestion", back_populates="quiz", cascade="all, delete-orphan", order_by="QuizQuestion.display_order")
+    questions = relationship("QuizQuestion", back_populates="quiz", cascade="all, delete-orphan", order_by="QuizQuestion.display_order", lazy="raise")
     attempts = relationship("QuizAttempt", back_populates="quiz", cascade="all, delete-orphan")
\ No newline at end of file
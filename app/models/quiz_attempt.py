@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, Boolean, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, Float, Boolean, ForeignKey, DateTime, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -7,8 +7,8 @@ from app.db.database import Base
 class QuizAttempt(Base):
     __tablename__ = "quiz_attempts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Results (nullable because filled after completion)
@@ -22,7 +22,13 @@ class QuizAttempt(Base):
     started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     
+    # Attempt history: WHERE user_id = ? AND quiz_id = ? ORDER BY started_at DESC
+    # (also covers plain user_id lookups)
+    __table_args__ = (
+        Index("ix_quiz_attempts_user_id_quiz_id_started_at", user_id, quiz_id, started_at.desc()),
+    )
+    
     # Relationships
     user = relationship("User", back_populates="quiz_attempts")
     quiz = relationship("Quiz", back_populates="attempts")
-    responses = relationship("QuizResponse", back_populates="attempt", cascade="all, delete-orphan")
\ No newline at end of file
+    responses = relationship("QuizResponse", back_populates="attempt", cascade="all, delete-orphan", lazy="raise")
\ No newline at end of file
@@ -14,9 +14,9 @@ Key Concepts:
 import uuid
 import secrets
 import enum
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, Enum, Text, Integer
+from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, Enum, Text, Integer, Index, and_, or_, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, backref
 
@@ -61,8 +61,7 @@ class SharedConversation(BaseModel):
     shared_by_user_id = Column(
         UUID(as_uuid=True), 
         ForeignKey("users.id", ondelete="CASCADE"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     
     # Share configuration
@@ -84,6 +83,11 @@ class SharedConversation(BaseModel):
     expires_at = Column(DateTime(timezone=True), nullable=True)
     view_count = Column(Integer, default=0, nullable=False)
     
+    # "My shares" listing: WHERE shared_by_user_id = ? ORDER BY created_at DESC
+    __table_args__ = (
+        Index("ix_shared_conversations_shared_by_user_id_created_at", "shared_by_user_id", "created_at"),
+    )
+    
     # Relationships
     conversation = relationship(
         "Conversation", 
@@ -96,12 +100,23 @@ class SharedConversation(BaseModel):
         """Check if the share has expired."""
         if self.expires_at is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        expires_at = self.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) > expires_at
     
     @property
     def is_accessible(self) -> bool:
         """Check if the share is currently accessible."""
         return self.is_active and not self.is_expired
+    
+    @classmethod
+    def accessible_filter(cls):
+        """SQL form of is_accessible, for use in WHERE clauses."""
+        return and_(
+            cls.is_active == True,
+            or_(cls.expires_at.is_(None), cls.expires_at > func.now()),
+        )
 
 
 class ConversationAccess(BaseModel):
@@ -126,14 +141,12 @@ class ConversationAccess(BaseModel):
     conversation_id = Column(
         UUID(as_uuid=True), 
         ForeignKey("conversations.id", ondelete="CASCADE"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     user_id = Column(
         UUID(as_uuid=True), 
         ForeignKey("users.id", ondelete="CASCADE"), 
-        nullable=False,
-        index=True
+        nullable=False
     )
     granted_by_user_id = Column(
         UUID(as_uuid=True), 
@@ -145,6 +158,13 @@ class ConversationAccess(BaseModel):
     can_reply = Column(Boolean, default=True, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     
+    # One grant per (conversation, user); the composites also cover the
+    # single-column lookups by conversation_id and user_id
+    __table_args__ = (
+        Index("uq_conversation_access_conversation_id_user_id", "conversation_id", "user_id", unique=True),
+        Index("ix_conversation_access_user_id_created_at", "user_id", "created_at"),
+    )
+    
     # Relationships
     conversation = relationship(
         "Conversation", 
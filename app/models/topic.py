@@ -55,7 +55,7 @@ class Topic(BaseModel):
     project = relationship("Project", back_populates="topics")
     document = relationship("Document", back_populates="topics")
     parent_topic = relationship("Topic", remote_side=lambda: Topic.id, backref="child_topics")
-    subtopics = relationship("Subtopic", back_populates="topic", cascade="all, delete-orphan")
+    subtopics = relationship("Subtopic", back_populates="topic", cascade="all, delete-orphan", lazy="raise")
     knowledge_states = relationship("KnowledgeState", back_populates="topic")
 
 
@@ -66,7 +66,7 @@ class Topic(BaseModel):
 class Subtopic(Base):
     __tablename__ = "subtopics"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     
     # Which topic does this subtopic belong to?
     topic_id = Column(
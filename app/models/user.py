@@ -18,8 +18,8 @@ class User(BaseModel):
     fcm_token = Column(String(500), nullable=True)
     
     # Relationships - User OWNS these
-    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan")
-    conversations = relationship("Conversation", back_populates="user", cascade="all, delete-orphan")
+    projects = relationship("Project", back_populates="owner", cascade="all, delete-orphan", lazy="raise")
+    conversations = relationship("Conversation", back_populates="user", cascade="all, delete-orphan", lazy="raise")
     knowledge_states = relationship("KnowledgeState", back_populates="user", cascade="all, delete-orphan")
     quiz_attempts = relationship("QuizAttempt", back_populates="user", cascade="all, delete-orphan")
     password_resets = relationship("PasswordReset", back_populates="user", cascade="all, delete-orphan")
@@ -5,9 +5,9 @@ Abstract base class for all repositories.
 Provides common database operations.
 """
 
-from typing import Generic, TypeVar, Type, Optional, List, Any
+from typing import Generic, TypeVar, Type, Optional, List, Any, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, insert
 
 from app.db.database import Base
 
@@ -33,10 +33,17 @@ class BaseRepository(Generic[ModelType]):
     # -----------------------------
     # Get Element By id
     # -----------------------------
-    async def get_by_id(self, id: Any) -> Optional[ModelType]:
-        """Get a record by ID (supports UUID, int, or string)."""
+    async def get_by_id(self, id: Any, options: Sequence[Any] = ()) -> Optional[ModelType]:
+        """
+        Get a record by ID (supports UUID, int, or string).
+        
+        Args:
+            id: Record ID
+            options: Loader options, e.g. (selectinload(Model.children),),
+                for relationships the caller is going to read
+        """
         result = await self.db.execute(
-            select(self.model).where(self.model.id == id)
+            select(self.model).options(*options).where(self.model.id == id)
         )
         return result.scalar_one_or_none()
     
@@ -70,32 +77,77 @@ class BaseRepository(Generic[ModelType]):
         await self.db.refresh(instance)
         return instance
 
+    # -----------------------------
+    # Create Many Records
+    # -----------------------------
+    async def bulk_create(
+        self,
+        rows: List[dict],
+        batch_size: int = 500,
+        commit: bool = True
+    ) -> List[ModelType]:
+        """
+        Create many records with one INSERT ... RETURNING per batch.
+        
+        Args:
+            rows: Column values for each record (same keys in every row)
+            batch_size: Rows per INSERT statement
+            commit: Commit once at the end; pass False to leave the rows
+                in the caller's transaction
+        
+        Returns:
+            The created records, in the order of `rows`
+        """
+        if not rows:
+            return []
+        
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        instances: List[ModelType] = []
+        for start in range(0, len(rows), batch_size):
+            result = await self.db.execute(stmt, rows[start:start + batch_size])
+            instances.extend(result.scalars().all())
+        
+        if commit:
+            await self.db.commit()
+        return instances
+
     # -----------------------------
     # Update record
     # -----------------------------
     async def update(self, id: Any, **kwargs) -> Optional[ModelType]:
-        """Update a record by ID (supports UUID, int, or string)."""
-        instance = await self.get_by_id(id)
-        if not instance:
-            return None
+        """
+        Update a record by ID (supports UUID, int, or string).
         
-        for key, value in kwargs.items():
-            setattr(instance, key, value)
+        Runs a single UPDATE ... RETURNING, so a missing record costs no
+        extra SELECT. A copy already loaded in the session is refreshed
+        with the returned row.
+        """
+        if not kwargs:
+            return await self.get_by_id(id)
         
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**kwargs)
+            .returning(self.model)
+        )
+        instance = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(instance)
         return instance
     
     # This used to Delete
     async def delete(self, id: Any) -> bool:
-        """Delete a record by ID (supports UUID, int, or string)."""
-        instance = await self.get_by_id(id)
-        if not instance:
-            return False
+        """
+        Delete a record by ID (supports UUID, int, or string).
         
-        await self.db.delete(instance)
+        Issues a single DELETE; child rows go through the foreign keys'
+        ON DELETE CASCADE rather than being loaded and deleted one by one.
+        """
+        result = await self.db.execute(
+            delete(self.model).where(self.model.id == id)
+        )
         await self.db.commit()
-        return True 
+        return result.rowcount > 0
     
     # this used to count records
     async def count(self) -> int:
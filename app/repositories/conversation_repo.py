@@ -4,17 +4,18 @@ Conversation Repository
 Data access layer for Conversation model.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import select, func, desc
+from sqlalchemy import select, update, func, desc, or_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.repositories.base import BaseRepository
 from app.models.conversation import Conversation
 from app.models.message import Message
+from app.models.shared_conversation import ConversationAccess
 
 
 class ConversationRepository(BaseRepository[Conversation]):
@@ -40,12 +41,43 @@ class ConversationRepository(BaseRepository[Conversation]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
     
+    async def get_viewable_with_messages(
+        self,
+        conversation_id: UUID,
+        user_id: UUID
+    ) -> Optional[Conversation]:
+        """
+        Get a conversation with messages if the user may view it.
+        
+        The access rule (owner, or an active private access grant) is part
+        of the WHERE clause, so the check and the load are one query.
+        Returns None if the conversation doesn't exist or isn't viewable.
+        """
+        has_grant = (
+            select(ConversationAccess.id)
+            .where(
+                ConversationAccess.conversation_id == self.model.id,
+                ConversationAccess.user_id == user_id,
+                ConversationAccess.is_active == True,
+            )
+            .exists()
+        )
+        stmt = (
+            select(self.model)
+            .options(selectinload(self.model.messages))
+            .where(self.model.id == conversation_id)
+            .where(or_(self.model.user_id == user_id, has_grant))
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+    
     async def get_user_conversations(
         self,
         user_id: UUID,
         project_id: Optional[UUID] = None,
         skip: int = 0,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Conversation]:
         """
         Get conversations for a user.
@@ -53,8 +85,9 @@ class ConversationRepository(BaseRepository[Conversation]):
         Args:
             user_id: User's ID
             project_id: Optional filter by project (None = all)
-            skip: Pagination offset
+            skip: Pagination offset (ignored when cursor is given)
             limit: Maximum results
+            cursor: (updated_at, id) of the last row of the previous page
         
         Returns:
             List ordered by most recent activity
@@ -68,13 +101,54 @@ class ConversationRepository(BaseRepository[Conversation]):
         if project_id is not None:
             stmt = stmt.where(self.model.project_id == project_id)
         
-        # Order by updated_at descending (most recent first)
-        stmt = stmt.order_by(desc(self.model.updated_at))
-        stmt = stmt.offset(skip).limit(limit)
+        stmt = self._page(stmt, skip, limit, cursor)
         
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
     
+    async def get_user_conversation_summaries(
+        self,
+        user_id: UUID,
+        project_id: Optional[UUID] = None,
+        skip: int = 0,
+        limit: int = 50,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> List[Tuple[Conversation, int, Optional[datetime]]]:
+        """
+        Get conversations for a user with their message stats.
+        
+        Same filters and ordering as get_user_conversations, but each row
+        also carries the message count and last message time, computed
+        in the same query instead of two extra queries per conversation.
+        
+        Returns:
+            (conversation, message_count, last_message_at) tuples
+        """
+        stmt = self._summary_query().where(self.model.user_id == user_id)
+        
+        if project_id is not None:
+            stmt = stmt.where(self.model.project_id == project_id)
+        
+        stmt = self._page(stmt, skip, limit, cursor)
+        
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+    
+    def _page(self, stmt, skip: int, limit: int, cursor: Optional[Tuple[datetime, UUID]]):
+        """
+        Order by most recent activity and cut one page.
+        
+        With a cursor this is a keyset seek, (updated_at, id) < cursor,
+        which the (user_id, updated_at) indexes serve without scanning
+        the skipped rows; otherwise it falls back to OFFSET.
+        """
+        stmt = stmt.order_by(desc(self.model.updated_at), desc(self.model.id))
+        if cursor is not None:
+            stmt = stmt.where(tuple_(self.model.updated_at, self.model.id) < tuple_(*cursor))
+        elif skip:
+            stmt = stmt.offset(skip)
+        return stmt.limit(limit)
+    
     async def get_quick_chats(
         self,
         user_id: UUID,
@@ -117,6 +191,46 @@ class ConversationRepository(BaseRepository[Conversation]):
         result = await self.db.execute(stmt)
         return result.scalar() or 0
     
+    async def get_message_counts(
+        self,
+        conversation_ids: List[UUID]
+    ) -> Dict[UUID, int]:
+        """Get message counts for many conversations in one GROUP BY query."""
+        if not conversation_ids:
+            return {}
+        stmt = (
+            select(Message.conversation_id, func.count(Message.id))
+            .where(Message.conversation_id.in_(conversation_ids))
+            .group_by(Message.conversation_id)
+        )
+        result = await self.db.execute(stmt)
+        return {conversation_id: count for conversation_id, count in result.all()}
+    
+    def _summary_query(self):
+        """
+        SELECT conversation, message count, last message time.
+        
+        The stats are correlated subqueries rather than a JOIN + GROUP BY,
+        so with LIMIT they are only computed for the rows returned.
+        """
+        message_count = (
+            select(func.count(Message.id))
+            .where(Message.conversation_id == self.model.id)
+            .correlate(self.model)
+            .scalar_subquery()
+        )
+        last_message_at = (
+            select(func.max(Message.created_at))
+            .where(Message.conversation_id == self.model.id)
+            .correlate(self.model)
+            .scalar_subquery()
+        )
+        return select(
+            self.model,
+            message_count.label("message_count"),
+            last_message_at.label("last_message_at"),
+        )
+    
     async def get_last_message_time(
         self,
         conversation_id: UUID
@@ -133,10 +247,15 @@ class ConversationRepository(BaseRepository[Conversation]):
         """
         Update conversation's updated_at timestamp.
         
-        Called when a new message is added.
+        Called when a new message is added, so it is a single UPDATE
+        with no fetch of the row. synchronize_session=False: now() can't be
+        evaluated in Python, so the default would expire updated_at on a
+        loaded Conversation and the next read would lazy-load it.
         """
-        conversation = await self.get_by_id(conversation_id)
-        if conversation:
-            # SQLAlchemy will auto-update updated_at
-            await self.db.commit()
-            await self.db.refresh(conversation)
\ No newline at end of file
+        await self.db.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation_id)
+            .values(updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
\ No newline at end of file
@@ -9,12 +9,12 @@ Data access layer for conversation sharing:
 
 import secrets
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, update, insert, delete, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, joinedload
 
 from app.repositories.base import BaseRepository
 from app.models.shared_conversation import (
@@ -71,23 +71,32 @@ class SharedConversationRepository(BaseRepository[SharedConversation]):
             expires_at=expires_at,
         )
     
-    async def get_by_token(self, token: str) -> Optional[SharedConversation]:
-        """Get a share by its unique token."""
-        stmt = (
+    def _by_token_query(self, token: str):
+        """SELECT a share by token, with conversation and sharer loaded."""
+        return (
             select(self.model)
             .where(self.model.share_token == token)
-            .options(selectinload(self.model.conversation))
+            .options(
+                selectinload(self.model.conversation),
+                joinedload(self.model.shared_by),
+            )
         )
-        result = await self.db.execute(stmt)
+    
+    async def get_by_token(self, token: str) -> Optional[SharedConversation]:
+        """Get a share by its unique token, with conversation and sharer loaded."""
+        result = await self.db.execute(self._by_token_query(token))
         return result.scalar_one_or_none()
     
     async def get_active_by_token(self, token: str) -> Optional[SharedConversation]:
-        """Get an active, non-expired share by token."""
-        share = await self.get_by_token(token)
+        """
+        Get an active, non-expired share by token.
         
-        if share and share.is_accessible:
-            return share
-        return None
+        The active/expiry check is part of the WHERE clause, so an inactive
+        or expired share isn't loaded (nor its conversation and sharer).
+        """
+        stmt = self._by_token_query(token).where(self.model.accessible_filter())
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
     
     async def get_user_shares(
         self,
@@ -140,11 +149,87 @@ class SharedConversationRepository(BaseRepository[SharedConversation]):
         return list(result.scalars().all())
     
     async def increment_view_count(self, share_id: UUID) -> None:
-        """Increment the view count for a share."""
-        share = await self.get_by_id(share_id)
-        if share:
-            share.view_count += 1
+        """
+        Increment the view count for a share.
+        
+        Single atomic UPDATE, so concurrent views can't lose increments.
+        """
+        await self.db.execute(
+            update(self.model)
+            .where(self.model.id == share_id)
+            .values(view_count=self.model.view_count + 1)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+    async def add_view_counts(self, deltas: Dict[str, int]) -> None:
+        """
+        Apply buffered view increments in one executemany UPDATE.
+
+        Args:
+            deltas: Mapping of share_token -> views to add
+        """
+        if not deltas:
+            return
+
+        # Core table UPDATE so the parameter list runs as a plain executemany
+        # instead of SQLAlchemy's ORM bulk-update-by-primary-key path.
+        table = self.model.__table__
+        stmt = (
+            update(table)
+            .where(table.c.share_token == bindparam("token"))
+            .values(view_count=table.c.view_count + bindparam("delta"))
+        )
+        await self.db.execute(
+            stmt,
+            [{"token": token, "delta": delta} for token, delta in deltas.items()],
+        )
+        await self.db.commit()
+
+    async def delete_owned(self, share_id: UUID, user_id: UUID) -> Optional[str]:
+        """
+        Delete a share if it belongs to the user, in a single statement.
+        
+        Returns:
+            The deleted share's token, or None if nothing was deleted
+        """
+        result = await self.db.execute(
+            delete(self.model)
+            .where(
+                self.model.id == share_id,
+                self.model.shared_by_user_id == user_id,
+            )
+            .returning(self.model.share_token)
+            .execution_options(synchronize_session=False)
+        )
+        token = result.scalar_one_or_none()
+        if token is not None:
             await self.db.commit()
+        return token
+    
+    async def get_tokens_for_conversation(self, conversation_id: UUID) -> List[str]:
+        """Share tokens of a conversation (to clear their cache on delete)."""
+        result = await self.db.execute(
+            select(self.model.share_token)
+            .where(self.model.conversation_id == conversation_id)
+        )
+        return list(result.scalars().all())
+    
+    async def get_tokens_for_project(self, project_id: UUID) -> List[str]:
+        """Share tokens of every conversation in a project."""
+        result = await self.db.execute(
+            select(self.model.share_token)
+            .join(Conversation, Conversation.id == self.model.conversation_id)
+            .where(Conversation.project_id == project_id)
+        )
+        return list(result.scalars().all())
+    
+    async def exists(self, share_id: UUID) -> bool:
+        """Check whether a share exists without loading it."""
+        result = await self.db.execute(
+            select(self.model.id).where(self.model.id == share_id)
+        )
+        return result.first() is not None
     
     async def deactivate(self, share_id: UUID) -> bool:
         """Deactivate a share link."""
@@ -198,6 +283,63 @@ class ConversationAccessRepository(BaseRepository[ConversationAccess]):
             can_reply=can_reply,
         )
     
+    async def grant_access_bulk(
+        self,
+        conversation_id: UUID,
+        user_ids: List[UUID],
+        granted_by_user_id: UUID,
+        can_reply: bool = True,
+    ) -> List[ConversationAccess]:
+        """
+        Grant many users access to a conversation in one transaction.
+        
+        Existing grants are re-activated with a single UPDATE ... RETURNING
+        and the rest are created with a single INSERT ... RETURNING.
+        
+        Args:
+            conversation_id: Conversation to share
+            user_ids: Users receiving access
+            granted_by_user_id: User granting access
+            can_reply: Whether recipients can fork
+        
+        Returns:
+            Access grants for all given users
+        """
+        if not user_ids:
+            return []
+        
+        result = await self.db.execute(
+            update(self.model)
+            .where(
+                self.model.conversation_id == conversation_id,
+                self.model.user_id.in_(user_ids),
+            )
+            .values(can_reply=can_reply, is_active=True)
+            .returning(self.model)
+        )
+        grants = list(result.scalars().all())
+        
+        existing_user_ids = {grant.user_id for grant in grants}
+        new_rows = [
+            {
+                "conversation_id": conversation_id,
+                "user_id": uid,
+                "granted_by_user_id": granted_by_user_id,
+                "can_reply": can_reply,
+            }
+            for uid in user_ids
+            if uid not in existing_user_ids
+        ]
+        if new_rows:
+            result = await self.db.scalars(
+                insert(self.model).returning(self.model),
+                new_rows,
+            )
+            grants.extend(result.all())
+        
+        await self.db.commit()
+        return grants
+    
     async def get_user_access(
         self,
         conversation_id: UUID,
@@ -5,14 +5,14 @@ Data access layer for User model.
 All user-related database operations.
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.repositories.base import BaseRepository
 from app.models import User
 from app.schemas.auth import UserRegister
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 
 class UserRepository(BaseRepository[User]):
     """Repository for User model."""
@@ -30,6 +30,18 @@ class UserRepository(BaseRepository[User]):
         )
         return result.scalar_one_or_none()
     
+    # =================
+    # Get by emails (batch)
+    # =================
+    async def get_by_emails(self, emails: List[str]) -> Dict[str, User]:
+        """Get users for many email addresses in one query, keyed by email."""
+        if not emails:
+            return {}
+        result = await self.db.execute(
+            select(User).where(User.email.in_(emails))
+        )
+        return {user.email: user for user in result.scalars().all()}
+    
     # =================
     # Get all users
     # =================
@@ -52,7 +64,7 @@ class UserRepository(BaseRepository[User]):
         # Create new user
         user = User(
            email=user_data.email,
-           password_hash=get_password_hash(user_data.password),
+           password_hash=await get_password_hash_async(user_data.password),
            full_name=user_data.full_name,
            is_active=True,
            default_socratic_mode=True
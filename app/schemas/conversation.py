@@ -212,12 +212,17 @@ class ConversationListResponse(BaseModel):
     """
     conversations: List[ConversationResponse]
     total: int
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Pass as `cursor` to fetch the next page (null on the last page)"
+    )
     
     class Config:
         json_schema_extra = {
             "example": {
                 "conversations": [],
-                "total": 0
+                "total": 0,
+                "next_cursor": None
             }
         }
 
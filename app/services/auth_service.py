@@ -10,8 +10,8 @@ from app.repositories.user_repo import UserRepository
 from app.repositories.password_reset_repo import PasswordResetRepository
 from app.schemas.auth import UserRegister, UserLogin, TokenResponse, UserResponse
 from app.core.security import (
-    verify_password,
-    get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     create_access_token,
     create_refresh_token,
     verify_refresh_token,
@@ -94,7 +94,7 @@ class AuthService:
         if user.auth_provider != "email" or user.password_hash is None:
             raise ValueError("This account uses Google Sign-In. Please use the Google button to log in.")
 
-        if not verify_password(login_data.password, user.password_hash):
+        if not await verify_password_async(login_data.password, user.password_hash):
             raise ValueError("Invalid email or password")
         
         # Check if user is active
@@ -273,7 +273,7 @@ class AuthService:
             raise ValueError("User not found")
         
         # Update password
-        user.password_hash = get_password_hash(new_password)
+        user.password_hash = await get_password_hash_async(new_password)
         await self.db.commit()
         
         # Mark code as used
@@ -15,8 +15,10 @@ NEW in LangChain version:
 - LangChain-based LLM calls
 """
 
+import base64
 import logging
-from typing import Optional, List, Dict, Any, AsyncGenerator
+from datetime import datetime
+from typing import Optional, List, Dict, Any, AsyncGenerator, Tuple
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -65,7 +67,8 @@ from app.ai.loaders.url_loader import (
     detect_url_type,
     URLType,
 )
-from app.repositories.sharing_repo import ConversationAccessRepository
+from app.repositories.sharing_repo import ConversationAccessRepository, SharedConversationRepository
+from app.services.sharing_service import invalidate_cached_shares
 from app.services.smart_tutor_service import SmartTutorService
 
 logger = logging.getLogger(__name__)
@@ -81,6 +84,20 @@ class ConversationNotFoundError(ChatServiceError):
     pass
 
 
+def _encode_cursor(updated_at: datetime, conversation_id: UUID) -> str:
+    """Opaque page cursor for the conversation list."""
+    raw = f"{updated_at.isoformat()}|{conversation_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        updated_at, conversation_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(updated_at), UUID(conversation_id)
+    except ValueError:
+        raise ChatServiceError("Invalid cursor")
+
+
 class ChatService:
     """
     Service for chat operations.
@@ -190,22 +207,29 @@ class ChatService:
         user_id: UUID,
         project_id: Optional[UUID] = None,
         skip: int = 0,
-        limit: int = 50
-    ) -> List[ConversationResponse]:
-        """List user's conversations."""
-        conversations = await self.conversation_repo.get_user_conversations(
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[ConversationResponse], Optional[str]]:
+        """
+        List user's conversations.
+        
+        Returns:
+            (conversations, next_cursor); next_cursor is None on the last page
+        
+        Raises:
+            ChatServiceError: If the cursor is malformed
+        """
+        summaries = await self.conversation_repo.get_user_conversation_summaries(
             user_id=user_id,
             project_id=project_id,
             skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=_decode_cursor(cursor) if cursor else None
         )
         
         project_name_cache: Dict[UUID, str] = {}
         result = []
-        for conv in conversations:
-            msg_count = await self.conversation_repo.get_message_count(conv.id)
-            last_msg = await self.conversation_repo.get_last_message_time(conv.id)
-            
+        for conv, msg_count, last_msg in summaries:
             p_name = None
             if conv.project_id:
                 if conv.project_id in project_name_cache:
@@ -230,7 +254,12 @@ class ChatService:
                 project_name=p_name,
             ))
         
-        return result
+        next_cursor = None
+        if len(summaries) == limit:
+            last = summaries[-1][0]
+            next_cursor = _encode_cursor(last.updated_at, last.id)
+        
+        return result, next_cursor
     
     async def delete_conversation(
         self,
@@ -250,12 +279,18 @@ class ChatService:
         if not conversation or conversation.user_id != user_id:
             raise ConversationNotFoundError("Conversation not found")
         
+        # The cascade removes its shares; their cached public views must go too
+        share_tokens = await SharedConversationRepository(self.db).get_tokens_for_conversation(
+            conversation_id
+        )
+        
         # Expunge the loaded instance from the session to prevent 
         # SQLAlchemy from trying to handle relationships via ORM cascade
         await self.db.execute(
             sql_delete(Conversation).where(Conversation.id == conversation_id)
         )
         await self.db.commit()
+        await invalidate_cached_shares(share_tokens)
         return True
     
     async def update_conversation(
@@ -8,8 +8,10 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.project_repo import ProjectRepository
+from app.repositories.sharing_repo import SharedConversationRepository
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.services.sharing_service import invalidate_cached_shares
 
 class ProjectService:
     """Service class for project operations."""
@@ -166,4 +168,11 @@ class ProjectService:
             ValueError: If project not found or not owned by user
         """
         project = await self.get_project(project_id, user_id)
-        return await self.project_repo.delete(project_id)    
\ No newline at end of file
+        
+        # Shares of the project's conversations go with the cascade; clear
+        # their cached public views too
+        share_tokens = await SharedConversationRepository(self.db).get_tokens_for_project(project_id)
+        deleted = await self.project_repo.delete(project_id)
+        if deleted:
+            await invalidate_cached_shares(share_tokens)
+        return deleted    
\ No newline at end of file
@@ -9,6 +9,7 @@ Business logic for quiz operations:
 
 import json
 import logging
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime, timezone
@@ -65,12 +66,31 @@ class QuizService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.quiz_repo = QuizRepository(db)
-        self.question_repo = QuizQuestionRepository(db)
-        self.attempt_repo = QuizAttemptRepository(db)
-        self.response_repo = QuizResponseRepository(db)
-        self.project_repo = ProjectRepository(db)
-        self.retriever: Retriever = get_retriever()
+
+    # Built on first use - each endpoint only touches one or two of these
+    @cached_property
+    def quiz_repo(self) -> QuizRepository:
+        return QuizRepository(self.db)
+
+    @cached_property
+    def question_repo(self) -> QuizQuestionRepository:
+        return QuizQuestionRepository(self.db)
+
+    @cached_property
+    def attempt_repo(self) -> QuizAttemptRepository:
+        return QuizAttemptRepository(self.db)
+
+    @cached_property
+    def response_repo(self) -> QuizResponseRepository:
+        return QuizResponseRepository(self.db)
+
+    @cached_property
+    def project_repo(self) -> ProjectRepository:
+        return ProjectRepository(self.db)
+
+    @cached_property
+    def retriever(self) -> Retriever:
+        return get_retriever()
 
     # ============================================================
     # GENERATE QUIZ (AI-powered)
@@ -15,9 +15,14 @@ Key Concepts:
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import AsyncIterator, Iterable, Optional, List, Dict, Any, Tuple
 from uuid import UUID
 
+import orjson
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.shared_conversation import (
@@ -46,9 +51,105 @@ from app.schemas.sharing import (
 )
 from app.schemas.conversation import MessageResponse
 from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.db.redis import get_redis
 
 logger = logging.getLogger(__name__)
 
+# Redis keys for the public share read path
+SHARE_CACHE_KEY = "share:{token}"   # Cached _CachedShare JSON
+SHARE_VIEWS_KEY = "share:views"     # Hash of token -> buffered view count
+# The view hash is renamed to this while it is being flushed
+SHARE_VIEWS_FLUSH_KEY = f"{SHARE_VIEWS_KEY}:flushing"
+# Held for the duration of a flush so two processes never apply one batch
+SHARE_VIEWS_FLUSH_LOCK_KEY = f"{SHARE_VIEWS_KEY}:lock"
+_SHARE_VIEWS_FLUSH_LOCK_TTL = 30
+
+
+class _CachedShare(BaseModel):
+    """Redis entry for a public share view, with the share's expiry."""
+    expires_at: Optional[datetime] = None
+    share: SharedConversationFull
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+async def invalidate_cached_shares(tokens: Iterable[str]) -> None:
+    """
+    Drop cached public share payloads.
+    
+    Called after a share changes or its conversation/project is deleted,
+    so the content stops being served before the cache TTL runs out.
+    """
+    keys = [SHARE_CACHE_KEY.format(token=token) for token in tokens]
+    if not keys:
+        return
+    try:
+        redis = await get_redis()
+        await redis.delete(*keys)
+    except Exception as e:
+        logger.warning("Share cache invalidation failed: %s", e)
+
+
+async def flush_share_views(redis) -> Tuple[int, int]:
+    """
+    Apply view counts buffered in Redis to the database.
+    
+    Public share views are counted with HINCRBY instead of a DB write
+    per request. The hash is atomically renamed (so new views keep
+    accumulating in a fresh one), then every token's delta is written in
+    a single batched UPDATE. Runs in the API process on a timer and from
+    the worker's cron; a Redis lock keeps concurrent runs from applying
+    the same batch twice.
+    
+    Returns:
+        (shares, views) flushed; (0, 0) if another run holds the lock
+    """
+    if not await redis.set(
+        SHARE_VIEWS_FLUSH_LOCK_KEY, 1, nx=True, ex=_SHARE_VIEWS_FLUSH_LOCK_TTL
+    ):
+        return 0, 0
+    try:
+        # A previous run may have died after the rename; finish that batch first
+        if not await redis.exists(SHARE_VIEWS_FLUSH_KEY):
+            if not await redis.exists(SHARE_VIEWS_KEY):
+                return 0, 0
+            await redis.rename(SHARE_VIEWS_KEY, SHARE_VIEWS_FLUSH_KEY)
+        
+        raw = await redis.hgetall(SHARE_VIEWS_FLUSH_KEY)
+        deltas = {
+            (token.decode() if isinstance(token, bytes) else token): int(count)
+            for token, count in raw.items()
+        }
+        
+        async with AsyncSessionLocal() as session:
+            await SharedConversationRepository(session).add_view_counts(deltas)
+        
+        await redis.delete(SHARE_VIEWS_FLUSH_KEY)
+    finally:
+        await redis.delete(SHARE_VIEWS_FLUSH_LOCK_KEY)
+    
+    total = sum(deltas.values())
+    logger.info("Flushed %d share views across %d shares", total, len(deltas))
+    return len(deltas), total
+
+
+def _message_to_dict(msg: Message) -> Dict[str, Any]:
+    """Public representation of a message in a shared conversation."""
+    return {
+        "id": str(msg.id),
+        "role": msg.role.value if hasattr(msg.role, 'value') else msg.role,
+        "content": msg.content,
+        "created_at": msg.created_at.isoformat() if msg.created_at else None,
+    }
+
+
+def is_streamed_share(full: SharedConversationFull) -> bool:
+    """Whether a shared view's messages were left out for streaming."""
+    return len(full.messages) < full.message_count
+
 
 class SharingServiceError(Exception):
     """Base exception for sharing service errors."""
@@ -78,12 +179,31 @@ class SharingService:
     
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.share_repo = SharedConversationRepository(db)
-        self.access_repo = ConversationAccessRepository(db)
-        self.fork_repo = ConversationForkRepository(db)
-        self.conversation_repo = ConversationRepository(db)
-        self.message_repo = MessageRepository(db)
-        self.user_repo = UserRepository(db)
+
+    # Built on first use - each endpoint only touches one or two of these
+    @cached_property
+    def share_repo(self) -> SharedConversationRepository:
+        return SharedConversationRepository(self.db)
+
+    @cached_property
+    def access_repo(self) -> ConversationAccessRepository:
+        return ConversationAccessRepository(self.db)
+
+    @cached_property
+    def fork_repo(self) -> ConversationForkRepository:
+        return ConversationForkRepository(self.db)
+
+    @cached_property
+    def conversation_repo(self) -> ConversationRepository:
+        return ConversationRepository(self.db)
+
+    @cached_property
+    def message_repo(self) -> MessageRepository:
+        return MessageRepository(self.db)
+
+    @cached_property
+    def user_repo(self) -> UserRepository:
+        return UserRepository(self.db)
     
     # ============================================================
     # PUBLIC SHARE LINKS
@@ -128,7 +248,7 @@ class SharingService:
             expires_in_days=expires_in_days,
         )
         
-        logger.info(f"Created public share {share.id} for conversation {conversation_id}")
+        logger.info("Created public share %s for conversation %s", share.id, conversation_id)
         
         return self._build_share_response(share)
     
@@ -145,11 +265,20 @@ class SharingService:
             increment_views: Whether to increment view count
         
         Returns:
-            Full shared conversation with messages
+            Full shared conversation with messages. For conversations longer
+            than SHARE_STREAM_MIN_MESSAGES, `messages` is empty (see
+            is_streamed_share) and must be streamed separately.
         
         Raises:
             ShareNotFoundError: If share doesn't exist or is expired
         """
+        cached = await self._get_cached_share(token)
+        if cached is not None:
+            if increment_views:
+                await self.record_view(token, share_id=cached.share_id)
+            return cached
+        
+        # Share, conversation and sharer are eager-loaded together
         share = await self.share_repo.get_active_by_token(token)
         
         if not share:
@@ -157,40 +286,51 @@ class SharingService:
         
         # Increment view count
         if increment_views:
-            await self.share_repo.increment_view_count(share.id)
+            await self.record_view(token, share_id=share.id)
         
-        # Get conversation with messages
-        conversation = await self.conversation_repo.get_with_messages(
-            share.conversation_id
-        )
-        
-        # Get sharer info
-        sharer = await self.user_repo.get_by_id(share.shared_by_user_id)
+        conversation = share.conversation
+        sharer = share.shared_by
         sharer_name = sharer.full_name if sharer else "Unknown"
         
-        # Build response
-        messages = [
-            {
-                "id": str(msg.id),
-                "role": msg.role.value if hasattr(msg.role, 'value') else msg.role,
-                "content": msg.content,
-                "created_at": msg.created_at.isoformat() if msg.created_at else None,
-            }
-            for msg in conversation.messages
-        ]
+        # Load at most one message past the streaming threshold, so long
+        # conversations are never fully materialized here
+        stream_after = settings.SHARE_STREAM_MIN_MESSAGES
+        rows = await self.message_repo.get_conversation_messages(
+            conversation.id, limit=stream_after + 1
+        )
         
-        return SharedConversationFull(
+        if len(rows) > stream_after:
+            # Too long to build in memory: messages are left empty and the
+            # endpoint streams them with stream_message_json()
+            message_count = await self.conversation_repo.get_message_count(
+                conversation.id
+            )
+            preview_messages = [_message_to_dict(msg) for msg in rows[:3]]
+            messages = []
+        else:
+            messages = [_message_to_dict(msg) for msg in rows]
+            message_count = len(messages)
+            preview_messages = messages[:3]
+        
+        full = SharedConversationFull(
             share_id=share.id,
             conversation_id=share.conversation_id,
             title=share.title or conversation.title,
             shared_by_name=sharer_name,
             shared_at=share.created_at,
-            message_count=len(messages),
+            message_count=message_count,
             allow_replies=share.allow_replies,
             is_socratic=conversation.is_socratic,
-            preview_messages=messages[:3],
+            preview_messages=preview_messages,
             messages=messages,
         )
+        
+        if is_streamed_share(full):
+            return full
+        
+        await self._cache_share(token, full, share.expires_at)
+        
+        return full
     
     async def get_my_shares(
         self,
@@ -205,7 +345,11 @@ class SharingService:
             limit=limit,
         )
         
-        return [self._build_share_response(share) for share in shares]
+        pending = await self._get_pending_views([share.share_token for share in shares])
+        return [
+            self._build_share_response(share, pending.get(share.share_token, 0))
+            for share in shares
+        ]
     
     async def update_share(
         self,
@@ -243,21 +387,35 @@ class SharingService:
         
         if update_data:
             share = await self.share_repo.update(share_id, **update_data)
+            await self._invalidate_cached_share(share.share_token)
         
-        return self._build_share_response(share)
+        pending = await self._get_pending_views([share.share_token])
+        return self._build_share_response(share, pending.get(share.share_token, 0))
     
     async def delete_share(
         self,
         share_id: UUID,
         user_id: UUID,
     ) -> bool:
-        """Delete a share link."""
-        share = await self.share_repo.get_by_id(share_id)
+        """
+        Delete a share link.
         
-        if not share or share.shared_by_user_id != user_id:
-            raise AccessDeniedError("You can only delete your own shares")
+        Returns:
+            False if the share doesn't exist
+        
+        Raises:
+            AccessDeniedError: If the share belongs to someone else
+        """
+        token = await self.share_repo.delete_owned(share_id, user_id)
+        
+        if token is None:
+            # Only the failure path pays for the 404-vs-403 lookup
+            if await self.share_repo.exists(share_id):
+                raise AccessDeniedError("You can only delete your own shares")
+            return False
         
-        return await self.share_repo.delete(share_id)
+        await self._invalidate_cached_share(token)
+        return True
     
     # ============================================================
     # PRIVATE SHARING
@@ -287,32 +445,35 @@ class SharingService:
         if not conversation or conversation.user_id != user_id:
             raise AccessDeniedError("You can only share your own conversations")
         
-        access_grants = []
+        # Resolve all recipients in one query
+        recipients = await self.user_repo.get_by_emails(user_emails)
         
         for email in user_emails:
-            # Find user by email
-            recipient = await self.user_repo.get_by_email(email)
-            
-            if not recipient:
-                logger.warning(f"User not found for email: {email}")
-                continue
-            
-            if recipient.id == user_id:
-                continue  # Skip self
-            
-            # Grant access
-            access = await self.access_repo.grant_access(
-                conversation_id=conversation_id,
-                user_id=recipient.id,
-                granted_by_user_id=user_id,
-                can_reply=can_reply,
-            )
-            
+            if email not in recipients:
+                logger.warning("User not found for email: %s", email)
+        
+        recipients_by_id = {
+            recipient.id: recipient
+            for recipient in recipients.values()
+            if recipient.id != user_id  # Skip self
+        }
+        
+        # Grant access to everyone in one transaction
+        grants = await self.access_repo.grant_access_bulk(
+            conversation_id=conversation_id,
+            user_ids=list(recipients_by_id),
+            granted_by_user_id=user_id,
+            can_reply=can_reply,
+        )
+        
+        access_grants = []
+        for access in grants:
+            recipient = recipients_by_id[access.user_id]
             access_grants.append(ConversationAccessResponse(
                 id=access.id,
                 conversation_id=access.conversation_id,
                 user_id=access.user_id,
-                user_email=email,
+                user_email=recipient.email,
                 user_name=recipient.full_name,
                 can_reply=access.can_reply,
                 is_active=access.is_active,
@@ -320,7 +481,7 @@ class SharingService:
             ))
         
         logger.info(
-            f"Shared conversation {conversation_id} with {len(access_grants)} users"
+            "Shared conversation %s with %d users", conversation_id, len(access_grants)
         )
         
         return access_grants
@@ -338,15 +499,16 @@ class SharingService:
             limit=limit,
         )
         
+        # Message counts for every conversation in one query
+        msg_counts = await self.conversation_repo.get_message_counts(
+            [access.conversation_id for access in access_list]
+        )
+        
         previews = []
         for access in access_list:
             conversation = access.conversation
             granter = access.granted_by
-            
-            # Get message count
-            msg_count = await self.conversation_repo.get_message_count(
-                conversation.id
-            )
+            msg_count = msg_counts.get(conversation.id, 0)
             
             previews.append(SharedConversationPreview(
                 share_id=access.id,
@@ -439,45 +601,32 @@ class SharingService:
         if not original:
             raise ShareNotFoundError("Conversation not found")
         
-        # Create new conversation for the user
-        forked = await self.conversation_repo.create(
-            user_id=user_id,
-            project_id=original.project_id,
-            title=f"Fork: {original.title}" if original.title else "Forked Conversation",
-            is_socratic=original.is_socratic,
-        )
+        return await self._copy_conversation(original, user_id)
+    
+    async def fork_conversation_if_allowed(
+        self,
+        conversation_id: UUID,
+        user_id: UUID,
+        initial_message: Optional[str] = None,
+    ) -> ConversationForkResponse:
+        """
+        Fork a conversation the user owns or was granted access to.
         
-        # Copy messages
-        last_message_id = None
-        for msg in original.messages:
-            await self.message_repo.create_message(
-                conversation_id=forked.id,
-                role=msg.role,
-                content=msg.content,
-                sources=msg.sources,
-            )
-            last_message_id = msg.id
+        The access check is folded into the query that loads the
+        conversation, so there is no separate can_view round trip.
         
-        # Record the fork
-        fork_record = await self.fork_repo.create_fork(
-            original_conversation_id=conversation_id,
-            forked_conversation_id=forked.id,
-            forked_by_user_id=user_id,
-            forked_at_message_id=last_message_id,
+        Raises:
+            AccessDeniedError: If the conversation doesn't exist or the
+                user can't view it
+        """
+        original = await self.conversation_repo.get_viewable_with_messages(
+            conversation_id, user_id
         )
         
-        logger.info(
-            f"User {user_id} forked conversation {conversation_id} "
-            f"to {forked.id}"
-        )
+        if not original:
+            raise AccessDeniedError("You don't have access to this conversation")
         
-        return ConversationForkResponse(
-            fork_id=fork_record.id,
-            conversation_id=forked.id,
-            original_conversation_id=conversation_id,
-            message_count=len(original.messages),
-            created_at=fork_record.created_at,
-        )
+        return await self._copy_conversation(original, user_id)
     
     async def fork_from_share(
         self,
@@ -530,9 +679,12 @@ class SharingService:
             share.conversation_id
         )
         
+        # Include views still buffered in Redis and not yet flushed
+        pending = await self._get_pending_views([share.share_token])
+        
         return ShareStatsResponse(
             share_id=share.id,
-            view_count=share.view_count,
+            view_count=share.view_count + pending.get(share.share_token, 0),
             fork_count=fork_count,
             access_grant_count=len(access_list),
             created_at=share.created_at,
@@ -543,11 +695,70 @@ class SharingService:
     # HELPERS
     # ============================================================
     
+    async def _copy_conversation(
+        self,
+        original: Conversation,
+        user_id: UUID,
+    ) -> ConversationForkResponse:
+        """
+        Copy a conversation (with messages loaded) for a user.
+        
+        The new conversation, its messages and the fork record are written
+        in a single transaction. Copied messages keep their original
+        timestamps so they stay in order.
+        """
+        forked = Conversation(
+            user_id=user_id,
+            project_id=original.project_id,
+            title=f"Fork: {original.title}" if original.title else "Forked Conversation",
+            is_socratic=original.is_socratic,
+        )
+        self.db.add(forked)
+        await self.db.flush()  # Assigns forked.id
+        
+        await self.message_repo.bulk_create(
+            [
+                {
+                    "conversation_id": forked.id,
+                    "role": msg.role,
+                    "content": msg.content,
+                    "sources": msg.sources,
+                    "created_at": msg.created_at,
+                }
+                for msg in original.messages
+            ],
+            commit=False,
+        )
+        
+        fork_record = ConversationFork(
+            original_conversation_id=original.id,
+            forked_conversation_id=forked.id,
+            forked_by_user_id=user_id,
+            forked_at_message_id=original.messages[-1].id if original.messages else None,
+        )
+        self.db.add(fork_record)
+        
+        await self.db.commit()
+        await self.db.refresh(fork_record)
+        
+        logger.info(
+            "User %s forked conversation %s to %s", user_id, original.id, forked.id
+        )
+        
+        return ConversationForkResponse(
+            fork_id=fork_record.id,
+            conversation_id=forked.id,
+            original_conversation_id=original.id,
+            message_count=len(original.messages),
+            created_at=fork_record.created_at,
+        )
+    
     def _build_share_response(
         self,
         share: SharedConversation,
+        pending_views: int = 0,
     ) -> SharedConversationResponse:
-        """Build a share response from the model."""
+        """Build a share response from the model (plus unflushed views)."""
         # Build share URL
         frontend_url = settings.FRONTEND_URL or "http://localhost:3000"
         share_url = f"{frontend_url}/shared/{share.share_token}"
@@ -561,8 +772,127 @@ class SharingService:
             allow_replies=share.allow_replies,
             is_active=share.is_active,
             expires_at=share.expires_at,
-            view_count=share.view_count,
+            view_count=share.view_count + pending_views,
             created_at=share.created_at,
             share_url=share_url,
             is_expired=share.is_expired,
         )
+    
+    @staticmethod
+    async def stream_message_json(
+        conversation_id: UUID,
+        batch_size: int = 200,
+    ) -> AsyncIterator[bytes]:
+        """
+        Yield a conversation's messages as comma-separated JSON objects.
+        
+        Rows are fetched with a server-side cursor in batches, so memory
+        stays bounded regardless of conversation length. Uses its own
+        session because it runs after the request's session is closed.
+        """
+        stmt = (
+            select(Message)
+            .where(Message.conversation_id == conversation_id)
+            .order_by(Message.created_at.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async with AsyncSessionLocal() as session:
+            result = await session.stream_scalars(stmt)
+            separator = b""
+            async for batch in result.partitions():
+                yield separator + b",".join(
+                    orjson.dumps(_message_to_dict(msg)) for msg in batch
+                )
+                separator = b","
+    
+    # ============================================================
+    # PUBLIC SHARE CACHE
+    # ============================================================
+    # Public share views are cached in Redis for SHARE_CACHE_TTL_SECONDS,
+    # and view counts are buffered in a Redis hash that flush_share_views
+    # applies to the DB in one batch (see _periodic_share_view_flush in
+    # app.main).
+    # Redis is optional: any Redis error falls back to the DB path.
+    
+    async def _get_cached_share(self, token: str) -> Optional[SharedConversationFull]:
+        """
+        Return the cached share payload, or None on miss/Redis error.
+        
+        An entry past the share's expires_at, or one that no longer
+        parses (e.g. written by an older schema), also counts as a miss.
+        """
+        if settings.SHARE_CACHE_TTL_SECONDS <= 0:
+            return None
+        try:
+            redis = await get_redis()
+            raw = await redis.get(SHARE_CACHE_KEY.format(token=token))
+        except Exception as e:
+            logger.warning("Share cache read failed: %s", e)
+            return None
+        if raw is None:
+            return None
+        try:
+            entry = _CachedShare.model_validate_json(raw)
+        except ValidationError:
+            logger.debug("Ignoring unreadable share cache entry for %s", token)
+            return None
+        if entry.expires_at is not None and _as_utc(entry.expires_at) <= datetime.now(timezone.utc):
+            return None
+        return entry.share
+    
+    async def _cache_share(
+        self,
+        token: str,
+        full: SharedConversationFull,
+        expires_at: Optional[datetime],
+    ) -> None:
+        """Store a share payload in Redis with the configured TTL (never past expiry)."""
+        ttl = settings.SHARE_CACHE_TTL_SECONDS
+        if expires_at is not None:
+            remaining = (_as_utc(expires_at) - datetime.now(timezone.utc)).total_seconds()
+            ttl = min(ttl, int(remaining))
+        if ttl <= 0:
+            return
+        try:
+            redis = await get_redis()
+            await redis.set(
+                SHARE_CACHE_KEY.format(token=token),
+                _CachedShare(expires_at=expires_at, share=full).model_dump_json(),
+                ex=ttl,
+            )
+        except Exception as e:
+            logger.warning("Share cache write failed: %s", e)
+    
+    async def _invalidate_cached_share(self, token: str) -> None:
+        """Drop a cached share payload after its settings change."""
+        await invalidate_cached_shares([token])
+    
+    async def record_view(self, token: str, share_id: UUID) -> None:
+        """Buffer a view in Redis, falling back to a direct DB increment."""
+        try:
+            redis = await get_redis()
+            await redis.hincrby(SHARE_VIEWS_KEY, token, 1)
+        except Exception as e:
+            logger.warning("Buffering share view failed, writing to DB: %s", e)
+            await self.share_repo.increment_view_count(share_id)
+    
+    async def _get_pending_views(self, tokens: List[str]) -> Dict[str, int]:
+        """
+        Views buffered in Redis that have not been flushed yet, per token.
+        
+        Counts both the live hash and a batch that is mid-flush.
+        """
+        if not tokens:
+            return {}
+        try:
+            redis = await get_redis()
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.hmget(SHARE_VIEWS_KEY, tokens)
+                pipe.hmget(SHARE_VIEWS_FLUSH_KEY, tokens)
+                live, flushing = await pipe.execute()
+        except Exception:
+            return {}
+        return {
+            token: int(a or 0) + int(b or 0)
+            for token, a, b in zip(tokens, live, flushing)
+        }
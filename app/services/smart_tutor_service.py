@@ -13,15 +13,19 @@ Features:
 - Learning style inference from interaction patterns
 """
 
+import asyncio
 import logging
+from functools import cached_property
 import math
 from datetime import datetime, timedelta, timezone, date
 from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
 
 from sqlalchemy import select, func, cast, Date, desc, and_
+from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.database import AsyncSessionLocal
 from app.models.knowledge_state import KnowledgeState
 from app.models.quiz_attempt import QuizAttempt
 from app.models.quiz import Quiz, QuizDifficulty
@@ -36,13 +40,41 @@ from app.ai.llm.langchain_client import chat_completion
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cap on the extra pooled sessions _read_concurrently holds at
+# once, so concurrent fan-outs can't starve the pool for other requests
+_FANOUT_SEMAPHORE = asyncio.Semaphore(8)
+
 
 class SmartTutorService:
     """All intelligent/adaptive features in one service."""
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.project_repo = ProjectRepository(db)
+
+    # Built on first use - only some endpoints need it
+    @cached_property
+    def project_repo(self) -> ProjectRepository:
+        return ProjectRepository(self.db)
+
+    @staticmethod
+    async def _read_concurrently(*statements) -> List[Result]:
+        """
+        Run independent read queries in parallel.
+
+        An AsyncSession can't run two statements at once, so each query
+        gets its own pooled session. Results come back buffered, in the
+        same order as the statements.
+
+        Callers should end the request session's transaction first, so its
+        connection goes back to the pool instead of being held alongside
+        the fan-out.
+        """
+        async def _run(stmt) -> Result:
+            async with _FANOUT_SEMAPHORE:
+                async with AsyncSessionLocal() as session:
+                    return await session.execute(stmt)
+
+        return list(await asyncio.gather(*(_run(stmt) for stmt in statements)))
 
     # ================================================================
     # 1. ADAPTIVE DIFFICULTY
@@ -228,7 +260,7 @@ class SmartTutorService:
         self,
         user_id: UUID,
         project_id: UUID,
-        exam_date: Optional[str] = None,
+        exam_date: Optional[date] = None,
         daily_hours: float = 2.0,
     ) -> Dict[str, Any]:
         """
@@ -239,36 +271,35 @@ class SmartTutorService:
         if not project or project.user_id != user_id:
             raise ValueError("Project not found")
 
-        # Gather topic mastery
-        result = await self.db.execute(
+        # The ownership check is all this session has done; end its
+        # transaction so the connection is free during the fan-out
+        await self.db.commit()
+
+        # Gather topic mastery (topics and per-topic averages in parallel)
+        topics_result, mastery_result = await self._read_concurrently(
             select(Topic.id, Topic.name, Topic.description)
             .where(Topic.project_id == project_id)
-            .order_by(Topic.display_order)
+            .order_by(Topic.display_order),
+            select(KnowledgeState.topic_id, func.avg(KnowledgeState.mastery_score))
+            .where(
+                KnowledgeState.user_id == user_id,
+                KnowledgeState.topic_id.isnot(None),
+            )
+            .group_by(KnowledgeState.topic_id),
         )
-        topics = result.all()
+        topics = topics_result.all()
+        mastery_by_topic = {topic_id: avg for topic_id, avg in mastery_result.all()}
 
         topic_mastery = []
         for t in topics:
-            result = await self.db.execute(
-                select(func.avg(KnowledgeState.mastery_score)).where(
-                    KnowledgeState.user_id == user_id,
-                    KnowledgeState.topic_id == t.id,
-                )
-            )
-            mastery = float(result.scalar() or 0)
+            mastery = float(mastery_by_topic.get(t.id) or 0)
             topic_mastery.append({
                 "name": t.name,
                 "description": t.description or "",
                 "mastery": round(mastery, 2),
             })
 
-        if exam_date:
-            try:
-                exam_dt = datetime.strptime(exam_date, "%Y-%m-%d").date()
-            except ValueError:
-                exam_dt = date.today() + timedelta(days=14)
-        else:
-            exam_dt = date.today() + timedelta(days=14)
+        exam_dt = exam_date or date.today() + timedelta(days=14)
 
         days_until = max(1, (exam_dt - date.today()).days)
 
@@ -342,20 +373,31 @@ class SmartTutorService:
         if not project or project.user_id != user_id:
             raise ValueError("Project not found")
 
-        # Total topics in project
-        result = await self.db.execute(
-            select(func.count(Topic.id)).where(Topic.project_id == project_id)
-        )
-        total_topics = result.scalar() or 0
+        # The ownership check is all this session has done; end its
+        # transaction so the connection is free during the fan-out
+        await self.db.commit()
 
-        # Knowledge states for this project
-        result = await self.db.execute(
+        # Topic count, knowledge states and quiz stats are independent reads
+        topics_result, states_result, quiz_result = await self._read_concurrently(
+            select(func.count(Topic.id)).where(Topic.project_id == project_id),
             select(KnowledgeState).where(
                 KnowledgeState.user_id == user_id,
                 KnowledgeState.project_id == project_id,
-            )
+            ),
+            select(func.avg(QuizAttempt.percentage), func.count(QuizAttempt.id))
+            .join(Quiz, QuizAttempt.quiz_id == Quiz.id)
+            .where(
+                QuizAttempt.user_id == user_id,
+                Quiz.project_id == project_id,
+                QuizAttempt.completed_at.isnot(None),
+            ),
         )
-        states = result.scalars().all()
+
+        # Total topics in project
+        total_topics = topics_result.scalar() or 0
+
+        # Knowledge states for this project
+        states = states_result.scalars().all()
 
         if not states and total_topics == 0:
             return {
@@ -373,16 +415,7 @@ class SmartTutorService:
         coverage = studied_topics / total_topics if total_topics > 0 else 0
 
         # 3. Quiz performance (25% weight)
-        result = await self.db.execute(
-            select(func.avg(QuizAttempt.percentage), func.count(QuizAttempt.id))
-            .join(Quiz, QuizAttempt.quiz_id == Quiz.id)
-            .where(
-                QuizAttempt.user_id == user_id,
-                Quiz.project_id == project_id,
-                QuizAttempt.completed_at.isnot(None),
-            )
-        )
-        row = result.one()
+        row = quiz_result.one()
         avg_quiz = float(row[0] or 0) / 100
         quiz_count = row[1] or 0
 
@@ -461,23 +494,23 @@ class SmartTutorService:
         if not project or project.user_id != user_id:
             raise ValueError("Project not found")
 
-        # Current project topics
-        result = await self.db.execute(
-            select(Topic.name).where(Topic.project_id == project_id)
-        )
-        current_topics = [r[0] for r in result.all()]
+        # The ownership check is all this session has done; end its
+        # transaction so the connection is free during the fan-out
+        await self.db.commit()
 
-        # Other project topics
-        result = await self.db.execute(
+        # Current and other project topics, fetched in parallel
+        current_result, other_result = await self._read_concurrently(
+            select(Topic.name).where(Topic.project_id == project_id),
             select(Project.name, Topic.name)
             .join(Topic, Topic.project_id == Project.id)
             .where(
                 Project.user_id == user_id,
                 Project.id != project_id,
             )
-            .limit(50)
+            .limit(50),
         )
-        other_topics = [{"project": r[0], "topic": r[1]} for r in result.all()]
+        current_topics = [r[0] for r in current_result.all()]
+        other_topics = [{"project": r[0], "topic": r[1]} for r in other_result.all()]
 
         if not current_topics or not other_topics:
             return {"connections": [], "message": "Need topics in multiple projects to find connections."}
@@ -539,56 +572,48 @@ class SmartTutorService:
         - Quiz performance across difficulties
         - Socratic mode preference
         """
-        # Check Socratic preference
-        result = await self.db.execute(
+        conversations_result, length_result, perf_result, quizzes_result = await self._read_concurrently(
+            # Socratic preference and total conversations
             select(
                 func.count(Conversation.id).filter(Conversation.is_socratic.is_(True)).label("socratic"),
                 func.count(Conversation.id).filter(Conversation.is_socratic.is_(False)).label("direct"),
-            ).where(Conversation.user_id == user_id)
-        )
-        row = result.one()
-        socratic_count = row.socratic or 0
-        direct_count = row.direct or 0
-
-        # Average message length (indicates preference for detail)
-        result = await self.db.execute(
+                func.count(Conversation.id).label("total"),
+            ).where(Conversation.user_id == user_id),
+            # Average message length (indicates preference for detail)
             select(func.avg(func.length(Message.content)))
             .join(Conversation, Message.conversation_id == Conversation.id)
             .where(
                 Conversation.user_id == user_id,
                 Message.role == MessageRole.USER,
-            )
-        )
-        avg_msg_length = float(result.scalar() or 0)
-
-        # Quiz performance by difficulty
-        result = await self.db.execute(
+            ),
+            # Quiz performance by difficulty
             select(Quiz.difficulty, func.avg(QuizAttempt.percentage))
             .join(Quiz, QuizAttempt.quiz_id == Quiz.id)
             .where(
                 QuizAttempt.user_id == user_id,
                 QuizAttempt.completed_at.isnot(None),
             )
-            .group_by(Quiz.difficulty)
+            .group_by(Quiz.difficulty),
+            # Total completed quizzes
+            select(func.count(QuizAttempt.id)).where(
+                QuizAttempt.user_id == user_id,
+                QuizAttempt.completed_at.isnot(None),
+            ),
         )
+
+        row = conversations_result.one()
+        socratic_count = row.socratic or 0
+        direct_count = row.direct or 0
+        total_convos = row.total or 0
+
+        avg_msg_length = float(length_result.scalar() or 0)
+
         perf_by_diff = {
             (r[0].value if hasattr(r[0], "value") else str(r[0])): round(float(r[1] or 0), 1)
-            for r in result.all()
+            for r in perf_result.all()
         }
 
-        # Total conversations & quizzes
-        result = await self.db.execute(
-            select(func.count(Conversation.id)).where(Conversation.user_id == user_id)
-        )
-        total_convos = result.scalar() or 0
-
-        result = await self.db.execute(
-            select(func.count(QuizAttempt.id)).where(
-                QuizAttempt.user_id == user_id,
-                QuizAttempt.completed_at.isnot(None),
-            )
-        )
-        total_quizzes = result.scalar() or 0
+        total_quizzes = quizzes_result.scalar() or 0
 
         # Determine style
         style = self._classify_learning_style(
@@ -6,6 +6,7 @@ Business logic for AI-powered topic extraction from project documents.
 
 import json
 import logging
+from functools import cached_property
 from typing import List
 from uuid import UUID
 
@@ -38,10 +39,23 @@ class TopicService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.topic_repo = TopicRepository(db)
-        self.subtopic_repo = SubtopicRepository(db)
-        self.project_repo = ProjectRepository(db)
-        self.retriever: Retriever = get_retriever()
+
+    # Built on first use - each endpoint only touches one or two of these
+    @cached_property
+    def topic_repo(self) -> TopicRepository:
+        return TopicRepository(self.db)
+
+    @cached_property
+    def subtopic_repo(self) -> SubtopicRepository:
+        return SubtopicRepository(self.db)
+
+    @cached_property
+    def project_repo(self) -> ProjectRepository:
+        return ProjectRepository(self.db)
+
+    @cached_property
+    def retriever(self) -> Retriever:
+        return get_retriever()
 
     # ============================================================
     # EXTRACT TOPICS (AI-powered)
@@ -21,7 +21,7 @@ from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
 from redis.asyncio import Redis
 
-from app.db.redis import get_redis
+from app.db.redis import get_redis, get_pubsub_redis
 
 logger = logging.getLogger(__name__)
 
@@ -247,8 +247,7 @@ class ConnectionManager:
         Uses pattern subscription to handle all conversation channels.
         """
         try:
-            redis = await get_redis()
-            pubsub = redis.pubsub()
+            pubsub = get_pubsub_redis().pubsub()
             
             # Subscribe to pattern: chat:* (all conversation channels)
             await pubsub.psubscribe("chat:*")
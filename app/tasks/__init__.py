@@ -6,6 +6,7 @@ This module contains all background task definitions for ARQ workers.
 Task Organization:
 -----------------
 - document_tasks.py: Document processing (parsing, embedding)
+- sharing_tasks.py: Periodic flush of buffered share view counts
 - Future: email_tasks.py, notification_tasks.py, etc.
 
 How Tasks Work:
@@ -31,9 +32,11 @@ Running Workers:
 """
 
 from app.tasks.document_tasks import process_document
+from app.tasks.sharing_tasks import flush_share_view_counts
 
 # Export all task functions
 # These names are used when enqueueing: enqueue_job('process_document', ...)
 __all__ = [
     "process_document",
+    "flush_share_view_counts",
 ]
\ No newline at end of file
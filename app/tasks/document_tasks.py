@@ -108,10 +108,13 @@ async def process_document(
         # If reprocessing, delete existing chunks first
         if document.chunk_count > 0:
             logger.info(f"Deleting existing chunks for reprocessing")
-            pipeline.delete_document_chunks(
-                document_id=doc_uuid,
-                project_id=document.project_id
-            )
+            try:
+                pipeline.delete_document_chunks(
+                    document_id=doc_uuid,
+                    project_id=document.project_id
+                )
+            except Exception as e:
+                raise ProcessingError(f"Failed to delete existing chunks: {e}")
         
         # Run the full processing pipeline
         result = await pipeline.process_document(
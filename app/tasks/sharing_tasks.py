@@ -0,0 +1,34 @@
+"""
+Sharing Tasks
+
+Periodic tasks for conversation sharing.
+"""
+
+import logging
+from typing import Any, Dict
+
+from app.services.sharing_service import flush_share_views
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================
+# VIEW COUNT FLUSH (CRON)
+# ============================================================
+
+async def flush_share_view_counts(ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply view counts buffered in Redis to the database.
+
+    The API process already flushes on a timer; this cron covers
+    deployments that also run the worker. Both go through
+    flush_share_views, which locks so a batch is applied once.
+
+    Args:
+        ctx: ARQ context (ctx['redis'] is the worker's Redis connection)
+
+    Returns:
+        Dict with the number of shares and views flushed
+    """
+    shares, views = await flush_share_views(ctx["redis"])
+    return {"shares": shares, "views": views}
@@ -45,17 +45,16 @@ from typing import Any, Dict, Optional
 from arq import cron
 from arq.connections import RedisSettings
 
+from app.core.logging_setup import setup_logging
 from app.db.redis import get_arq_redis_settings
 from app.tasks.document_tasks import process_document
+from app.tasks.sharing_tasks import flush_share_view_counts
 
 # ============================================================
 # Logging Configuration
 # ============================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+setup_logging("INFO")
 logger = logging.getLogger(__name__)
 
 
@@ -141,6 +140,14 @@ class WorkerSettings:
         process_document,
     ]
     
+    # ========================================
+    # Scheduled Jobs
+    # ========================================
+    # Runs every minute (at second 0)
+    cron_jobs = [
+        cron(flush_share_view_counts, second=0),
+    ]
+    
     # ========================================
     # Redis Connection
     # ========================================
@@ -0,0 +1,27 @@
+"""
+One-time migration: rebuild legacy L2 ChromaDB project collections
+under cosine distance, so search scores are true cosine similarities.
+
+Usage:
+    python -m scripts.migrate_vector_cosine
+
+Safe to re-run; collections already on cosine are skipped and a run
+that was interrupted is finished first.
+
+Running API and worker processes pick up the rebuilt collections on
+their next call (stale handles are reloaded), so no restart is needed.
+"""
+
+import logging
+
+from app.db.vector_store import get_vector_store
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    migrated = get_vector_store().migrate_collections_to_cosine()
+    print(f"Rebuilt {migrated} collection(s) with cosine distance")
+
+
+if __name__ == "__main__":
+    main()